@@ -3,20 +3,11 @@
 Public API exports for client library usage.
 """
 
+import importlib
+import os
+from typing import TYPE_CHECKING
+
 from .auth import AuthProvider, JWTAuthProvider, NoAuthProvider, get_default_auth
-from .auth_models import (
-    PublicKeyResponse,
-    TokenResponse,
-    UserCreateRequest,
-    UserResponse,
-    UserUpdateRequest,
-)
-from .intelligence_models import (
-    FaceResponse,
-    EntityJobResponse,
-    KnownPersonResponse,
-)
-from .compute_client import ComputeClient
 from .config import ComputeClientConfig
 from .exceptions import (
     AuthenticationError,
@@ -26,21 +17,88 @@ from .exceptions import (
     PermissionError,
     WorkerUnavailableError,
 )
-from .models import JobResponse, OnJobResponseCallback, WorkerCapabilitiesResponse, WorkerCapability
-from .mqtt_monitor import MQTTJobMonitor
 from .server_pref import ServerPref
-from .session_manager import SessionManager
-from .store_manager import StoreManager
-from .store_models import (
-    Entity,
-    EntityListResponse,
-    EntityPagination,
-    EntityVersion,
-    StorePref,
-    StoreOperationResult,
-)
 
-__all__ = [
+if TYPE_CHECKING:
+    from .auth_models import (
+        PublicKeyResponse,
+        TokenResponse,
+        UserCreateRequest,
+        UserResponse,
+        UserUpdateRequest,
+    )
+    from .compute_client import ComputeClient
+    from .intelligence_models import (
+        EntityJobResponse,
+        FaceResponse,
+        KnownPersonResponse,
+    )
+    from .models import (
+        JobResponse,
+        OnJobResponseCallback,
+        WorkerCapabilitiesResponse,
+        WorkerCapability,
+    )
+    from .mqtt_monitor import MQTTJobMonitor
+    from .session_manager import SessionManager
+    from .store_manager import StoreManager
+    from .store_models import (
+        Entity,
+        EntityListResponse,
+        EntityPagination,
+        EntityVersion,
+        StoreOperationResult,
+        StorePref,
+    )
+
+# Exports backed by httpx, pydantic or paho-mqtt are resolved on first access
+# (PEP 562) so `import cl_client` stays cheap for callers that only need auth/config.
+_LAZY: dict[str, str] = {
+    "PublicKeyResponse": ".auth_models",
+    "TokenResponse": ".auth_models",
+    "UserCreateRequest": ".auth_models",
+    "UserResponse": ".auth_models",
+    "UserUpdateRequest": ".auth_models",
+    "ComputeClient": ".compute_client",
+    "EntityJobResponse": ".intelligence_models",
+    "FaceResponse": ".intelligence_models",
+    "KnownPersonResponse": ".intelligence_models",
+    "JobResponse": ".models",
+    "OnJobResponseCallback": ".models",
+    "WorkerCapabilitiesResponse": ".models",
+    "WorkerCapability": ".models",
+    "MQTTJobMonitor": ".mqtt_monitor",
+    "SessionManager": ".session_manager",
+    "StoreManager": ".store_manager",
+    "Entity": ".store_models",
+    "EntityListResponse": ".store_models",
+    "EntityPagination": ".store_models",
+    "EntityVersion": ".store_models",
+    "StoreOperationResult": ".store_models",
+    "StorePref": ".store_models",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a lazily exported name and cache it in the module namespace."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+# Resolve everything up front (e.g. in CI) to surface import errors immediately
+if os.environ.get("CL_CLIENT_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        _ = __getattr__(_name)
+
+__all__ = (
     # Client
     "ComputeClient",
     # Configuration
@@ -85,4 +143,4 @@ __all__ = [
     "StoreManager",
     # MQTT
     "MQTTJobMonitor",
-]
+)
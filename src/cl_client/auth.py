@@ -4,12 +4,63 @@ Auth providers follow a simple protocol: they must implement get_headers().
 This allows easy swapping between no-auth, JWT, API key, etc.
 """
 
-import base64
-import json
+from __future__ import annotations
+
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime
-from typing import cast, override
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+# Headers returned by NoAuthProvider; callers copy them into their own requests
+_NO_AUTH_HEADERS: dict[str, str] = {}
+
+# Base64 padding indexed by len(payload) % 4
+_B64_PADDING = ("", "===", "==", "=")
+
+
+def _parse_exp(token: str) -> float | None:
+    """Extract the 'exp' claim of a JWT as a Unix timestamp.
+
+    Decodes the payload without verification. JWTAuthProvider caches the
+    result for its current token (see JWTAuthProvider._token_exp).
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Expiry as Unix timestamp, or None if parsing fails or no exp claim
+    """
+    # Imported here so NoAuthProvider-only users never load them; after the
+    # first token these are sys.modules lookups
+    import base64
+    import json
+
+    try:
+        # JWT format: header.payload.signature
+        if token.count(".") != 2:
+            return None
+
+        # Decode payload (second part), sliced out without splitting the token
+        payload_b64 = token[token.index(".") + 1 : token.rindex(".")]
+
+        # Add padding if needed (base64 requires length multiple of 4)
+        payload_b64 += _B64_PADDING[len(payload_b64) & 3]
+
+        # Decode and parse JSON (json.loads detects UTF-8 bytes directly)
+        payload_bytes = base64.urlsafe_b64decode(payload_b64)
+        payload = json.loads(payload_bytes)
+
+        # Extract exp claim (Unix timestamp); "+ 0.0" coerces int to float and
+        # rejects non-numeric values, indexing rejects non-dict payloads
+        return payload["exp"] + 0.0
+
+    except (ValueError, KeyError, TypeError):
+        # If parsing fails, return None (token refresh will use other mechanisms)
+        return None
 
 
 class AuthProvider(ABC):
@@ -44,9 +95,9 @@ class NoAuthProvider(AuthProvider):
         """Get authentication headers.
 
         Returns:
-            Empty dict (no authentication)
+            Empty dict (no authentication), shared between calls; do not mutate
         """
-        return {}
+        return _NO_AUTH_HEADERS
 
     @override
     async def refresh_token_if_needed(self) -> None:
@@ -99,6 +150,25 @@ class JWTAuthProvider(AuthProvider):
         self._token: str | None = token
         self.get_cached_token: Callable[[], str] | None = get_cached_token
         self.get_valid_token_async: Callable[[], Awaitable[str]] | None = get_valid_token_async
+        # (token, headers) for the last token seen by get_headers()
+        self._cached_header: tuple[str, dict[str, str]] | None = None
+        # (token, exp) for the last token whose expiry was parsed; only the
+        # provider's current token is kept alive, not a process-wide history
+        self._cached_exp: tuple[str, float | None] | None = None
+
+    def _token_exp(self, token: str) -> float | None:
+        """Get a token's 'exp' claim, parsing it once per token.
+
+        should_refresh() runs on every request while the same token is reused
+        for minutes, and a token's exp never changes.
+        """
+        cached = self._cached_exp
+        if cached is not None and cached[0] == token:
+            return cached[1]
+
+        exp_timestamp = _parse_exp(token)
+        self._cached_exp = (token, exp_timestamp)
+        return exp_timestamp
 
     def _parse_token_expiry(self, token: str) -> datetime | None:
         """Parse JWT token to extract expiry time.
@@ -118,46 +188,17 @@ class JWTAuthProvider(AuthProvider):
             >>> if expiry:
             ...     print(f"Token expires at {expiry}")
         """
-        try:
-            # JWT format: header.payload.signature
-            parts = token.split(".")
-            if len(parts) != 3:
-                return None
-
-            # Decode payload (second part)
-            payload_b64 = parts[1]
-
-            # Add padding if needed (base64 requires length multiple of 4)
-            padding = 4 - (len(payload_b64) % 4)
-            if padding != 4:
-                payload_b64 += "=" * padding
-
-            # Decode and parse JSON
-            payload_bytes = base64.urlsafe_b64decode(payload_b64)
-            payload_raw = cast(object, json.loads(payload_bytes.decode("utf-8")))
-
-            # Validate payload is a dictionary
-            if not isinstance(payload_raw, dict):
-                return None
-
-            payload = cast(dict[str, object], payload_raw)
+        from datetime import UTC, datetime
 
-            # Extract exp claim (Unix timestamp)
-            exp_timestamp_raw = payload.get("exp")
-            if exp_timestamp_raw is None:
-                return None
-
-            # Validate exp is a number
-            if not isinstance(exp_timestamp_raw, (int, float)):
-                return None
-
-            exp_timestamp = float(exp_timestamp_raw)
+        exp_timestamp = self._token_exp(token)
+        if exp_timestamp is None:
+            return None
 
-            # Convert to datetime
+        # Convert to datetime (out-of-range or non-finite exp values are treated
+        # like a missing claim)
+        try:
             return datetime.fromtimestamp(exp_timestamp, tz=UTC)
-
-        except (ValueError, KeyError, json.JSONDecodeError):
-            # If parsing fails, return None (token refresh will use other mechanisms)
+        except (ValueError, OverflowError, OSError):
             return None
 
     def should_refresh(self, token: str) -> bool:
@@ -178,16 +219,13 @@ class JWTAuthProvider(AuthProvider):
             ...     # Trigger token refresh
             ...     new_token = await session.get_valid_token()
         """
-        expiry = self._parse_token_expiry(token)
-        if expiry is None:
+        exp_timestamp = self._token_exp(token)
+        if exp_timestamp is None:
             # Can't determine expiry, assume token is valid
             return False
 
-        now = datetime.now(UTC)
-        time_until_expiry = (expiry - now).total_seconds()
-
         # Refresh if less than 60 seconds until expiry
-        return time_until_expiry < 60
+        return exp_timestamp - time.time() < 60
 
     def get_token(self) -> str:
         """Get current token.
@@ -236,6 +274,9 @@ class JWTAuthProvider(AuthProvider):
         synchronous and cannot perform token refresh. Call refresh_token_if_needed()
         before using this method to ensure the token is fresh.
 
+        The header dict is built once per token and reused until the token
+        changes, so callers must copy it rather than mutate it.
+
         Returns:
             Authorization header with Bearer token
 
@@ -244,13 +285,20 @@ class JWTAuthProvider(AuthProvider):
         """
 
         token = self.get_token()
-        return {"Authorization": f"Bearer {token}"}
+        cached = self._cached_header
+        if cached is None or cached[0] != token:
+            cached = (token, {"Authorization": f"Bearer {token}"})
+            self._cached_header = cached
+        return cached[1]
 
 
 def get_default_auth() -> AuthProvider:
     """Get default auth provider (no-auth for Phase 1).
 
     Returns:
-        NoAuthProvider instance
+        Shared NoAuthProvider instance (stateless)
     """
-    return NoAuthProvider()
+    return _DEFAULT_AUTH
+
+
+_DEFAULT_AUTH = NoAuthProvider()
@@ -4,9 +4,11 @@ Provides direct wrappers for all auth service endpoints without lifecycle manage
 For high-level auth operations (login, logout, token refresh), use SessionManager instead.
 """
 
-from typing import cast
+import asyncio
+from collections.abc import Sequence
 
 import httpx
+from pydantic import TypeAdapter
 
 from .auth_models import (
     PublicKeyResponse,
@@ -15,8 +17,11 @@ from .auth_models import (
     UserResponse,
     UserUpdateRequest,
 )
+from .config import ComputeClientConfig
 from .server_pref import ServerPref
 
+_USER_LIST_ADAPTER: TypeAdapter[list[UserResponse]] = TypeAdapter(list[UserResponse])
+
 
 class AuthClient:
     """Low-level client for auth service REST API.
@@ -41,6 +46,7 @@ class AuthClient:
         base_url: str | None = None,
         server_pref: ServerPref | None = None,
         timeout: float = 60.0,
+        limits: httpx.Limits | None = None,
     ) -> None:
         """Initialize auth client.
 
@@ -48,16 +54,39 @@ class AuthClient:
             base_url: Auth service URL (overrides server_pref.auth_url)
             server_pref: Server configuration (default: from environment)
             timeout: Request timeout in seconds
+            limits: Connection pool limits (default from ComputeClientConfig)
         """
         # Get config for defaults (from parameter or environment)
         config = server_pref or ServerPref.from_env()
         self.base_url: str = base_url or config.auth_url
         self.timeout: float = timeout
+        self.limits: httpx.Limits = limits or ComputeClientConfig.http_limits()
 
         self._session: httpx.AsyncClient = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self.timeout,
+            timeout=ComputeClientConfig.http_timeout(self.timeout),
+            # Pool options go on the client, not a custom transport=, so
+            # httpx still honours HTTP(S)_PROXY / ALL_PROXY / NO_PROXY
+            limits=self.limits,
+            http2=ComputeClientConfig.http2_enabled(),
         )
+        # Last token's Authorization header; held per client so the raw
+        # token is released with the client (or replaced on rotation)
+        self._bearer_cache: tuple[str, httpx.Headers] | None = None
+
+    def _bearer(self, token: str) -> httpx.Headers:
+        """Authorization header for a token, built once per token.
+
+        Returned as ``httpx.Headers`` so httpx does not re-normalise a plain
+        dict on every request. httpx copies request headers into a fresh
+        Headers object when merging, so the shared instance is never mutated.
+        """
+        cached = self._bearer_cache
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        headers = httpx.Headers({"Authorization": f"Bearer {token}"})
+        self._bearer_cache = (token, headers)
+        return headers
 
     # ========================================================================
     # Token Management
@@ -88,7 +117,7 @@ class AuthClient:
         )
         _ = response.raise_for_status()
 
-        return TokenResponse.model_validate(response.json())
+        return TokenResponse.model_validate_json(response.content)
 
     async def refresh_token(self, token: str) -> TokenResponse:
         """Refresh access token.
@@ -110,11 +139,11 @@ class AuthClient:
         """
         response = await self._session.post(
             "/auth/token/refresh",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
         )
         _ = response.raise_for_status()
 
-        return TokenResponse.model_validate(response.json())
+        return TokenResponse.model_validate_json(response.content)
 
     async def get_public_key(self) -> PublicKeyResponse:
         """Get public key for token verification.
@@ -131,7 +160,7 @@ class AuthClient:
         response = await self._session.get("/auth/public-key")
         _ = response.raise_for_status()
 
-        return PublicKeyResponse.model_validate(response.json())
+        return PublicKeyResponse.model_validate_json(response.content)
 
     # ========================================================================
     # User Management
@@ -157,11 +186,11 @@ class AuthClient:
         """
         response = await self._session.get(
             "/users/me",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
         )
         _ = response.raise_for_status()
 
-        return UserResponse.model_validate(response.json())
+        return UserResponse.model_validate_json(response.content)
 
     # ========================================================================
     # Admin User Management
@@ -204,12 +233,12 @@ class AuthClient:
 
         response = await self._session.post(
             "/users/",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
             data=form_data,
         )
         _ = response.raise_for_status()
 
-        return UserResponse.model_validate(response.json())
+        return UserResponse.model_validate_json(response.content)
 
     async def list_users(
         self,
@@ -241,13 +270,13 @@ class AuthClient:
         """
         response = await self._session.get(
             "/users/",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
             params={"skip": skip, "limit": limit},
         )
         _ = response.raise_for_status()
 
-        data = cast(list[object], response.json())
-        return [UserResponse.model_validate(item) for item in data]
+        # Parse and validate the whole page in one pydantic-core pass
+        return _USER_LIST_ADAPTER.validate_json(response.content)
 
     async def get_user(self, token: str, user_id: int) -> UserResponse:
         """Get user by ID (admin only).
@@ -273,11 +302,52 @@ class AuthClient:
         """
         response = await self._session.get(
             f"/users/{user_id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
         )
         _ = response.raise_for_status()
 
-        return UserResponse.model_validate(response.json())
+        return UserResponse.model_validate_json(response.content)
+
+    async def get_users(self, token: str, user_ids: Sequence[int]) -> list[UserResponse]:
+        """Get several users by ID concurrently (admin only).
+
+        Issues one GET /users/{user_id} per ID over the pooled connections, with
+        at most limits.max_connections lookups in flight at once. The first
+        failure cancels the lookups that are still pending.
+
+        Args:
+            token: Admin access token
+            user_ids: User IDs to fetch
+
+        Returns:
+            UserResponse for each requested user, in the order of user_ids
+
+        Raises:
+            httpx.HTTPStatusError: First failure among the lookups
+                (401, 403, or 404 if a user is not found)
+
+        Example:
+            users = await client.get_users(token="admin_token", user_ids=[2, 3, 5])
+            for user in users:
+                print(f"User {user.id}: {user.username}")
+        """
+        # Bound the fan-out to the pool size so a long ID list does not queue
+        # every request against the auth server at once
+        in_flight = asyncio.Semaphore(
+            self.limits.max_connections or ComputeClientConfig.HTTP_MAX_CONNECTIONS
+        )
+
+        async def _get_bounded(user_id: int) -> UserResponse:
+            async with in_flight:
+                return await self.get_user(token, user_id)
+
+        lookups = [asyncio.ensure_future(_get_bounded(user_id)) for user_id in user_ids]
+        try:
+            return list(await asyncio.gather(*lookups))
+        finally:
+            # Stop the remaining lookups once one of them has failed
+            for lookup in lookups:
+                _ = lookup.cancel()
 
     async def update_user(
         self,
@@ -320,12 +390,12 @@ class AuthClient:
 
         response = await self._session.put(
             f"/users/{user_id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
             data=update_data,
         )
         _ = response.raise_for_status()
 
-        return UserResponse.model_validate(response.json())
+        return UserResponse.model_validate_json(response.content)
 
     async def delete_user(self, token: str, user_id: int) -> None:
         """Delete user (admin only).
@@ -348,7 +418,7 @@ class AuthClient:
         """
         response = await self._session.delete(
             f"/users/{user_id}",
-            headers={"Authorization": f"Bearer {token}"},
+            headers=self._bearer(token),
         )
         _ = response.raise_for_status()
 
@@ -358,6 +428,7 @@ class AuthClient:
 
     async def close(self) -> None:
         """Close HTTP session and cleanup resources."""
+        self._bearer_cache = None
         await self._session.aclose()
 
     async def __aenter__(self) -> "AuthClient":
@@ -5,8 +5,32 @@ ensuring type-safe interactions with the authentication API.
 """
 
 from datetime import datetime
+from typing import cast
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _to_form_payload(model: BaseModel) -> dict[str, str]:
+    """Flatten a request model into string form fields.
+
+    None fields are omitted, booleans become "true"/"false" and the permissions
+    list is joined into one comma-separated value. Field values are read from
+    the instance ``__dict__`` in a single pass rather than via ``model_dump()``.
+    """
+    payload: dict[str, str] = {}
+    for key, value in cast(dict[str, object], model.__dict__).items():
+        if value is None:
+            continue
+        if key == "permissions":
+            payload[key] = ",".join(cast(list[str], value))
+        elif value is True:
+            payload[key] = "true"
+        elif value is False:
+            payload[key] = "false"
+        else:
+            payload[key] = str(value)
+    return payload
 
-from pydantic import BaseModel, Field
 
 # ============================================================================
 # Token Models
@@ -23,6 +47,8 @@ class TokenResponse(BaseModel):
         }
     """
 
+    model_config = ConfigDict(frozen=True)  # pyright: ignore[reportUnannotatedClassAttribute]
+
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(..., description="Token type (always 'bearer')")
 
@@ -37,6 +63,8 @@ class PublicKeyResponse(BaseModel):
         }
     """
 
+    model_config = ConfigDict(frozen=True)  # pyright: ignore[reportUnannotatedClassAttribute]
+
     public_key: str = Field(..., description="Public key for token verification (PEM format)")
     algorithm: str = Field(..., description="JWT algorithm (ES256)")
 
@@ -62,6 +90,8 @@ class UserResponse(BaseModel):
         }
     """
 
+    model_config = ConfigDict(frozen=True)  # pyright: ignore[reportUnannotatedClassAttribute]
+
     id: int = Field(..., description="User ID")
     username: str = Field(..., description="Username")
     is_admin: bool = Field(False, description="Whether user has admin privileges")
@@ -86,6 +116,8 @@ class UserCreateRequest(BaseModel):
         }
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")  # pyright: ignore[reportUnannotatedClassAttribute]
+
     username: str = Field(..., description="Username (must be unique)")
     password: str = Field(..., description="User password (will be hashed)")
     is_admin: bool = Field(False, description="Grant admin privileges")
@@ -99,19 +131,7 @@ class UserCreateRequest(BaseModel):
             Dictionary with string values for form data submission.
             Booleans are converted to lowercase strings ("true"/"false").
         """
-        data_dict = self.model_dump(exclude_none=True)
-
-        # Convert to string values for form data
-        data: dict[str, str] = {}
-        for key, value in data_dict.items():
-            if key == "permissions":
-                data[key] = ",".join(self.permissions)
-            elif isinstance(value, bool):
-                data[key] = "true" if value else "false"
-            else:
-                data[key] = str(value)
-
-        return data
+        return _to_form_payload(self)
 
 
 class UserUpdateRequest(BaseModel):
@@ -128,6 +148,8 @@ class UserUpdateRequest(BaseModel):
         }
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")  # pyright: ignore[reportUnannotatedClassAttribute]
+
     password: str | None = Field(None, description="New password (optional)")
     permissions: list[str] | None = Field(None, description="Update permissions (optional)")
     is_active: bool | None = Field(None, description="Update active status (optional)")
@@ -140,16 +162,4 @@ class UserUpdateRequest(BaseModel):
             Dictionary with string values for form data submission.
             Booleans are converted to lowercase strings ("true"/"false").
         """
-        data_dict = self.model_dump(exclude_none=True)
-
-        # Convert to string values for form data
-        data: dict[str, str] = {}
-        for key, value in data_dict.items():
-            if key == "permissions" and value is not None:
-                data[key] = ",".join(value) if isinstance(value, list) else str(value)
-            elif isinstance(value, bool):
-                data[key] = "true" if value else "false"
-            else:
-                data[key] = str(value)
-
-        return data
+        return _to_form_payload(self)
@@ -10,7 +10,7 @@ Provides high-level interface for:
 from __future__ import annotations
 
 import asyncio
-import time
+from functools import cached_property
 from typing import TYPE_CHECKING, override
 
 import httpx
@@ -21,13 +21,16 @@ from cl_client.plugins.base import ClientProtocol
 
 from .auth import AuthProvider, NoAuthProvider
 from .config import ComputeClientConfig
+from .exceptions import ComputeClientError
+from .models import JobResponse, WorkerCapabilitiesResponse
 from .mqtt_monitor import MQTTJobMonitor, get_mqtt_monitor, release_mqtt_monitor
 from .server_pref import ServerPref
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
     from pathlib import Path
 
-    from .models import JobResponse, OnJobResponseCallback, WorkerCapabilitiesResponse
+    from .models import OnJobResponseCallback
     from .plugins.clip_embedding import ClipEmbeddingClient
     from .plugins.dino_embedding import DinoEmbeddingClient
     from .plugins.exif import ExifClient
@@ -39,6 +42,26 @@ if TYPE_CHECKING:
     from .plugins.media_thumbnail import MediaThumbnailClient
 
 
+class _ProviderAuth(httpx.Auth):
+    """httpx auth flow that applies the client's current AuthProvider headers.
+
+    Runs once per request, so rotated or refreshed JWTs are picked up without
+    rebuilding the AsyncClient and without every call site fetching headers.
+    """
+
+    def __init__(self, client: ComputeClient) -> None:
+        self._client: ComputeClient = client
+
+    @override
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        provider = self._client.auth
+        await provider.refresh_token_if_needed()
+        request.headers.update(provider.get_headers())
+        yield request
+
+
 class JobCreatedResponse(BaseModel):
     job_id: str
     status: str
@@ -63,6 +86,7 @@ class ComputeClient(ClientProtocol):
         mqtt_url: str | None = None,
         auth_provider: AuthProvider | None = None,
         server_pref: ServerPref | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
         """Initialize compute client.
 
@@ -72,6 +96,7 @@ class ComputeClient(ClientProtocol):
             mqtt_url: MQTT broker URL (overrides server_pref.mqtt_url)
             auth_provider: Authentication provider (default: NoAuthProvider)
             server_pref: Server configuration (default: from environment)
+            limits: Connection pool limits (default from ComputeClientConfig)
 
         Example (Simple):
             client = ComputeClient()  # Uses defaults
@@ -91,12 +116,18 @@ class ComputeClient(ClientProtocol):
         self.base_url: str = base_url or config.compute_url
         self.timeout: float = timeout or ComputeClientConfig.DEFAULT_TIMEOUT
         self.auth: AuthProvider = auth_provider or NoAuthProvider()
+        self.limits: httpx.Limits = limits or ComputeClientConfig.http_limits()
 
-        # HTTP client for REST API
+        # HTTP client for REST API (keep-alive pool reused across job polls);
+        # auth headers are applied per request by the auth flow
         self._session: httpx.AsyncClient = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self.timeout,
-            headers=self.auth.get_headers(),
+            timeout=ComputeClientConfig.http_timeout(self.timeout),
+            auth=_ProviderAuth(self),
+            # Pool options go on the client, not a custom transport=, so
+            # httpx still honours HTTP(S)_PROXY / ALL_PROXY / NO_PROXY
+            limits=self.limits,
+            http2=ComputeClientConfig.http2_enabled(),
         )
 
         # MQTT monitor for job status and worker capabilities
@@ -104,13 +135,11 @@ class ComputeClient(ClientProtocol):
         mqtt_url_final = mqtt_url or config.mqtt_url
         self._mqtt: MQTTJobMonitor = get_mqtt_monitor(url=mqtt_url_final)
 
-    async def _get_request_headers(self) -> dict[str, str]:
-        """Get fresh authentication headers for a request.
+        # (ETag, parsed body) of the last get_capabilities response that had one
+        self._capabilities_etag: tuple[str, WorkerCapabilitiesResponse] | None = None
 
-        Ensures token is refreshed if needed before getting headers.
-        """
-        await self.auth.refresh_token_if_needed()
-        return self.auth.get_headers()
+        # job_id -> in-flight get_job request shared by concurrent callers
+        self._inflight_jobs: dict[str, asyncio.Task[JobResponse]] = {}
 
     async def update_guest_mode(self, guest_mode: bool) -> bool:
         """Update guest mode configuration (admin only).
@@ -133,11 +162,9 @@ class ComputeClient(ClientProtocol):
             "guest_mode": str(guest_mode).lower(),
         }
 
-        headers = await self._get_request_headers()
         response = await self._session.put(
             f"{self.base_url}/admin/pref/guest-mode",
             data=data,  # Form data, not JSON
-            headers=headers,
         )
         _ = response.raise_for_status()
         return True
@@ -154,11 +181,7 @@ class ComputeClient(ClientProtocol):
         if not self._session:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
-        headers = await self._get_request_headers()
-        response = await self._session.get(
-            f"{self.base_url}/admin/pref/guest-mode",
-            headers=headers,
-        )
+        response = await self._session.get(f"{self.base_url}/admin/pref/guest-mode")
         _ = response.raise_for_status()
         # Expecting JSON response like {"guest_mode": true}
         data = response.json()
@@ -174,23 +197,26 @@ class ComputeClient(ClientProtocol):
         data: RequestData | None,
         files: RequestFiles | None,
     ) -> str:
-        headers = await self._get_request_headers()
         response = await self._session.post(  # type: ignore[reportPrivateUsage]
             endpoint,
             files=files,  # type: ignore[arg-type]
             data=data,
-            headers=headers,
         )
         _ = response.raise_for_status()
-        job = JobCreatedResponse.model_validate(response.json())
-        return job.job_id
+        return JobCreatedResponse.model_validate_json(response.content).job_id
 
     @override
-    async def get_job(self, job_id: str) -> JobResponse:
+    async def get_job(self, job_id: str, fresh: bool = False) -> JobResponse:
         """Get job status via REST API.
 
+        Concurrent calls for the same job share a single in-flight request;
+        cancelling one caller does not cancel the request for the others.
+
         Args:
             job_id: Job ID to query
+            fresh: Start a new request instead of joining one that may have been
+                sent before a state change the caller already knows about (e.g.
+                an MQTT completion event). Later calls join the fresh request.
 
         Returns:
             Current job status
@@ -198,14 +224,30 @@ class ComputeClient(ClientProtocol):
         Raises:
             httpx.HTTPStatusError: If request fails
         """
-        from .models import JobResponse
-
-        endpoint = ComputeClientConfig.ENDPOINT_GET_JOB.format(job_id=job_id)
-        headers = await self._get_request_headers()
-        response = await self._session.get(endpoint, headers=headers)
+        task = None if fresh else self._inflight_jobs.get(job_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_job(job_id))
+            self._inflight_jobs[job_id] = task
+
+            def _done(done: asyncio.Task[JobResponse]) -> None:
+                # A fresh request may have replaced this one in the map
+                if self._inflight_jobs.get(job_id) is done:
+                    del self._inflight_jobs[job_id]
+                # Retrieve the error even when every caller was cancelled, so
+                # asyncio does not log "exception was never retrieved"
+                if not done.cancelled():
+                    _ = done.exception()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _fetch_job(self, job_id: str) -> JobResponse:
+        """Fetch job status from the server (one HTTP request)."""
+        endpoint = ComputeClientConfig.get_job_endpoint(job_id)
+        response = await self._session.get(endpoint)
         _ = response.raise_for_status()
 
-        return JobResponse.model_validate(response.json())  # type: ignore[arg-type]
+        return JobResponse.model_validate_json(response.content)
 
     async def delete_job(self, job_id: str) -> None:
         """Delete job via REST API.
@@ -217,30 +259,82 @@ class ComputeClient(ClientProtocol):
             httpx.HTTPStatusError: If request fails
         """
         endpoint = ComputeClientConfig.ENDPOINT_DELETE_JOB.format(job_id=job_id)
-        headers = await self._get_request_headers()
-        response = await self._session.delete(endpoint, headers=headers)
+        response = await self._session.delete(endpoint)
         _ = response.raise_for_status()
 
-    async def download_job_file(self, job_id: str, file_path: str, dest: Path) -> None:
+    async def download_job_file(
+        self,
+        job_id: str,
+        file_path: str,
+        dest: Path,
+        chunk_size: int | None = None,
+        max_bytes: int | None = None,
+    ) -> int:
         """Download file from job's output directory.
 
+        The response body is streamed to disk chunk by chunk, so memory use stays
+        bounded by chunk_size regardless of the file size. Each chunk is written
+        from a worker thread so disk I/O does not block the event loop.
+
+        When max_bytes is given the download is refused if Content-Length
+        already exceeds it, and aborted as soon as the body grows past it. If
+        the download fails or is cancelled part-way, the partially written
+        file is removed.
+
         Args:
             job_id: Job ID
             file_path: Relative file path within job directory (from task_output)
             dest: Local destination path to save file
+            chunk_size: Bytes per streamed read (default from ComputeClientConfig)
+            max_bytes: Optional upper bound on the downloaded size (default: no limit)
+
+        Returns:
+            Number of bytes written to dest
 
         Raises:
             httpx.HTTPStatusError: If request fails
+            ComputeClientError: If the body exceeds max_bytes
+            httpx.TransportError: If the connection fails mid-stream
         """
-        endpoint = ComputeClientConfig.ENDPOINT_GET_JOB_FILE.format(
-            job_id=job_id, file_path=file_path
-        )
-        headers = await self._get_request_headers()
-        response = await self._session.get(endpoint, headers=headers)
-        _ = response.raise_for_status()
-
-        # Write file content to destination
-        _ = dest.write_bytes(response.content)
+        endpoint = ComputeClientConfig.get_job_file_endpoint(job_id, file_path)
+        chunk_size_val = chunk_size or ComputeClientConfig.DOWNLOAD_CHUNK_SIZE
+        bytes_written = 0
+
+        async with self._session.stream("GET", endpoint) as response:
+            _ = response.raise_for_status()
+
+            # Refuse up front when the server already announces an oversized
+            # body, before dest is created or truncated
+            content_length = response.headers.get("content-length", "")
+            if (
+                max_bytes is not None
+                and content_length.isdigit()
+                and int(content_length) > max_bytes
+            ):
+                raise ComputeClientError(
+                    f"Download of {file_path} for job {job_id} is {content_length} bytes, "
+                    f"exceeds max_bytes={max_bytes}"
+                )
+
+            # Write file content to destination as it arrives; the write
+            # syscall runs in a worker thread so the event loop keeps serving
+            # other requests while large chunks hit the disk
+            try:
+                with dest.open("wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size_val):
+                        if max_bytes is not None and bytes_written + len(chunk) > max_bytes:
+                            raise ComputeClientError(
+                                f"Download of {file_path} for job {job_id} "
+                                f"exceeds max_bytes={max_bytes}"
+                            )
+                        bytes_written += await asyncio.to_thread(f.write, chunk)
+            except BaseException:
+                # Never leave a truncated file behind: covers the size limit,
+                # network errors mid-stream and cancellation alike
+                dest.unlink(missing_ok=True)
+                raise
+
+        return bytes_written
 
     # ============================================================================
     # Worker Capabilities (REST API)
@@ -249,20 +343,30 @@ class ComputeClient(ClientProtocol):
     async def get_capabilities(self) -> WorkerCapabilitiesResponse:
         """Get current worker capabilities via REST API.
 
+        If the server tagged the previous response with an ETag, the request is
+        made conditional; a 304 Not Modified returns the previously parsed
+        response without transferring or validating a body again.
+
         Returns:
             Worker capabilities summary
 
         Raises:
             httpx.HTTPStatusError: If request fails
         """
-        from .models import WorkerCapabilitiesResponse
-
         endpoint = ComputeClientConfig.ENDPOINT_CAPABILITIES
-        headers = await self._get_request_headers()
-        response = await self._session.get(endpoint, headers=headers)
+        cached = self._capabilities_etag
+        if cached is None:
+            response = await self._session.get(endpoint)
+        else:
+            response = await self._session.get(endpoint, headers={"If-None-Match": cached[0]})
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return cached[1]
         _ = response.raise_for_status()
 
-        return WorkerCapabilitiesResponse.model_validate(response.json())  # type: ignore[arg-type]
+        capabilities = WorkerCapabilitiesResponse.model_validate_json(response.content)
+        etag = response.headers.get("etag")
+        self._capabilities_etag = (etag, capabilities) if etag else None
+        return capabilities
 
     async def wait_for_workers(
         self,
@@ -286,9 +390,18 @@ class ComputeClient(ClientProtocol):
 
         timeout_val = timeout or ComputeClientConfig.WORKER_WAIT_TIMEOUT
 
-        # Wait for each required capability
-        for capability in required_capabilities:
-            _ = await self._mqtt.wait_for_capability(capability, timeout=timeout_val)
+        # Wait for all required capabilities concurrently, so the total wait is
+        # the slowest capability rather than the sum of all of them
+        waits = [
+            asyncio.ensure_future(self._mqtt.wait_for_capability(capability, timeout=timeout_val))
+            for capability in dict.fromkeys(required_capabilities)
+        ]
+        try:
+            _ = await asyncio.gather(*waits)
+        finally:
+            # Stop the remaining waits once one of them has failed
+            for wait in waits:
+                _ = wait.cancel()
 
         return True
 
@@ -335,6 +448,31 @@ class ComputeClient(ClientProtocol):
             task_type=task_type,
         )
 
+    def mqtt_subscribe_job_updates_batch(
+        self,
+        job_ids: list[str],
+        on_progress: OnJobResponseCallback = None,
+        on_complete: OnJobResponseCallback = None,
+        task_type: str = "unknown",
+    ) -> list[str]:
+        """Subscribe the same callbacks to updates for many jobs via MQTT.
+
+        Args:
+            job_ids: Job IDs to monitor
+            on_progress: Called on each job update (queued → in_progress → ...)
+            on_complete: Called only when job completes (status: completed/failed)
+            task_type: Task type for the jobs (used to populate JobResponse)
+
+        Returns:
+            Subscription IDs, in the same order as job_ids
+        """
+        return self._mqtt.subscribe_job_updates_batch(
+            job_ids=job_ids,
+            on_progress=on_progress,
+            on_complete=on_complete,
+            task_type=task_type,
+        )
+
     def unsubscribe(self, subscription_id: str) -> None:
         """Unsubscribe from job updates using subscription ID.
 
@@ -359,6 +497,11 @@ class ComputeClient(ClientProtocol):
         Use this for simple synchronous workflows. For production use,
         prefer MQTT callback-based monitoring (subscribe_job_updates).
 
+        While waiting between polls, the client also listens for the job's MQTT
+        completion event and re-checks over HTTP as soon as it arrives, so a
+        finished job is picked up without sitting out the remaining backoff.
+        If MQTT is unavailable, plain HTTP polling with backoff still applies.
+
         Args:
             job_id: Job ID to monitor
             poll_interval: Polling interval in seconds (default from config)
@@ -371,34 +514,67 @@ class ComputeClient(ClientProtocol):
             TimeoutError: If timeout expires before job completes
             httpx.HTTPStatusError: If HTTP requests fail
         """
-        start_time = time.time()
         interval = poll_interval or ComputeClientConfig.DEFAULT_POLL_INTERVAL
         backoff = interval
-
-        while True:
-            job = await self.get_job(job_id)
-
-            # Check if job is terminal
-            if job.status in ["completed", "failed"]:
-                return job
-
-            # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                msg = f"Job {job_id} timeout after {timeout}s (status: {job.status})"
-                raise TimeoutError(msg)
-
-            # Wait with exponential backoff
-            await asyncio.sleep(backoff)
-            backoff = min(
-                backoff * ComputeClientConfig.POLL_BACKOFF_MULTIPLIER,
-                ComputeClientConfig.MAX_POLL_BACKOFF,
-            )
+        backoff_multiplier = ComputeClientConfig.POLL_BACKOFF_MULTIPLIER
+        max_backoff = ComputeClientConfig.MAX_POLL_BACKOFF
+        terminal_statuses = ComputeClientConfig.TERMINAL_JOB_STATUSES
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        completed = asyncio.Event()
+        notified: list[JobResponse] = []
+
+        def _on_complete(job: JobResponse) -> None:
+            # Runs on the MQTT network thread
+            notified.append(job)
+            _ = loop.call_soon_threadsafe(completed.set)
+
+        sub_id = self._mqtt.subscribe_job_updates(job_id, on_complete=_on_complete)
+        woken = False
+        try:
+            while True:
+                # After an MQTT wake-up, don't join a request that may have been
+                # sent before the job finished
+                job = await self.get_job(job_id, fresh=woken)
+
+                # Check if job is terminal
+                if job.status in terminal_statuses:
+                    return job
+
+                # Check timeout before waiting; the last wait is clipped to the
+                # remaining budget so the final poll lands on the deadline
+                wait_for = backoff
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        msg = f"Job {job_id} timeout after {timeout}s (status: {job.status})"
+                        raise TimeoutError(msg)
+                    wait_for = min(backoff, remaining)
+
+                # Wait with exponential backoff, waking early on MQTT completion.
+                # The event is cleared after a wake-up so that, if the HTTP view
+                # still lags behind MQTT, later polls fall back to the backoff
+                try:
+                    _ = await asyncio.wait_for(completed.wait(), wait_for)
+                    completed.clear()
+                    woken = True
+                except TimeoutError:
+                    woken = False
+                backoff = min(backoff * backoff_multiplier, max_backoff)
+        finally:
+            # The monitor drops the subscription itself once on_complete fired
+            if not notified:
+                self._mqtt.unsubscribe(sub_id)
 
     # ============================================================================
     # Plugin Access (Lazy-loaded properties)
     # ============================================================================
+    # Plugin clients hold no HTTP client of their own: every request goes through
+    # this ComputeClient (http_submit_job/get_job/wait_for_job), so all plugins
+    # share one AsyncClient and its keep-alive pool. New plugins must keep it so.
 
-    @property
+    @cached_property
     def clip_embedding(self) -> ClipEmbeddingClient:
         """Access CLIP embedding plugin.
 
@@ -412,13 +588,11 @@ class ComputeClient(ClientProtocol):
             )
             embedding = job.task_output["embedding"]
         """
-        if not hasattr(self, "_clip_embedding"):
-            from .plugins.clip_embedding import ClipEmbeddingClient
+        from .plugins.clip_embedding import ClipEmbeddingClient
 
-            self._clip_embedding: ClipEmbeddingClient = ClipEmbeddingClient(self)
-        return self._clip_embedding  # type: ignore[has-type]
+        return ClipEmbeddingClient(self)
 
-    @property
+    @cached_property
     def dino_embedding(self) -> DinoEmbeddingClient:
         """Access DINO embedding plugin.
 
@@ -432,13 +606,11 @@ class ComputeClient(ClientProtocol):
             )
             embedding = job.task_output["embedding"]
         """
-        if not hasattr(self, "_dino_embedding"):
-            from .plugins.dino_embedding import DinoEmbeddingClient
+        from .plugins.dino_embedding import DinoEmbeddingClient
 
-            self._dino_embedding: DinoEmbeddingClient = DinoEmbeddingClient(self)
-        return self._dino_embedding  # type: ignore[has-type]
+        return DinoEmbeddingClient(self)
 
-    @property
+    @cached_property
     def exif(self) -> ExifClient:
         """Access EXIF extraction plugin.
 
@@ -452,13 +624,11 @@ class ComputeClient(ClientProtocol):
             )
             metadata = job.task_output
         """
-        if not hasattr(self, "_exif"):
-            from .plugins.exif import ExifClient
+        from .plugins.exif import ExifClient
 
-            self._exif: ExifClient = ExifClient(self)
-        return self._exif  # type: ignore[has-type]
+        return ExifClient(self)
 
-    @property
+    @cached_property
     def face_detection(self) -> FaceDetectionClient:
         """Access face detection plugin.
 
@@ -472,13 +642,11 @@ class ComputeClient(ClientProtocol):
             )
             faces = job.task_output["faces"]
         """
-        if not hasattr(self, "_face_detection"):
-            from .plugins.face_detection import FaceDetectionClient
+        from .plugins.face_detection import FaceDetectionClient
 
-            self._face_detection: FaceDetectionClient = FaceDetectionClient(self)
-        return self._face_detection  # type: ignore[has-type]
+        return FaceDetectionClient(self)
 
-    @property
+    @cached_property
     def face_embedding(self) -> FaceEmbeddingClient:
         """Access face embedding plugin.
 
@@ -492,13 +660,11 @@ class ComputeClient(ClientProtocol):
             )
             embeddings = job.task_output["embeddings"]
         """
-        if not hasattr(self, "_face_embedding"):
-            from .plugins.face_embedding import FaceEmbeddingClient
+        from .plugins.face_embedding import FaceEmbeddingClient
 
-            self._face_embedding: FaceEmbeddingClient = FaceEmbeddingClient(self)
-        return self._face_embedding  # type: ignore[has-type]
+        return FaceEmbeddingClient(self)
 
-    @property
+    @cached_property
     def hash(self) -> HashClient:
         """Access perceptual hash plugin.
 
@@ -512,13 +678,11 @@ class ComputeClient(ClientProtocol):
             )
             hashes = job.task_output
         """
-        if not hasattr(self, "_hash"):
-            from .plugins.hash import HashClient
+        from .plugins.hash import HashClient
 
-            self._hash: HashClient = HashClient(self)
-        return self._hash  # type: ignore[has-type]
+        return HashClient(self)
 
-    @property
+    @cached_property
     def hls_streaming(self) -> HlsStreamingClient:
         """Access HLS streaming plugin.
 
@@ -532,13 +696,11 @@ class ComputeClient(ClientProtocol):
             )
             manifest = job.task_output["manifest_path"]
         """
-        if not hasattr(self, "_hls_streaming"):
-            from .plugins.hls_streaming import HlsStreamingClient
+        from .plugins.hls_streaming import HlsStreamingClient
 
-            self._hls_streaming: HlsStreamingClient = HlsStreamingClient(self)
-        return self._hls_streaming  # type: ignore[has-type]
+        return HlsStreamingClient(self)
 
-    @property
+    @cached_property
     def image_conversion(self) -> ImageConversionClient:
         """Access image conversion plugin.
 
@@ -554,13 +716,11 @@ class ComputeClient(ClientProtocol):
             )
             output = job.task_output["output_path"]
         """
-        if not hasattr(self, "_image_conversion"):
-            from .plugins.image_conversion import ImageConversionClient
+        from .plugins.image_conversion import ImageConversionClient
 
-            self._image_conversion: ImageConversionClient = ImageConversionClient(self)
-        return self._image_conversion  # type: ignore[has-type]
+        return ImageConversionClient(self)
 
-    @property
+    @cached_property
     def media_thumbnail(self) -> MediaThumbnailClient:
         """Access media thumbnail plugin.
 
@@ -574,11 +734,9 @@ class ComputeClient(ClientProtocol):
                 height=256
             )
         """
-        if not hasattr(self, "_media_thumbnail"):
-            from .plugins.media_thumbnail import MediaThumbnailClient
+        from .plugins.media_thumbnail import MediaThumbnailClient
 
-            self._media_thumbnail: MediaThumbnailClient = MediaThumbnailClient(self)
-        return self._media_thumbnail  # type: ignore[has-type]
+        return MediaThumbnailClient(self)
 
     # ============================================================================
     # Cleanup
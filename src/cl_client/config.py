@@ -4,6 +4,88 @@ All endpoints, hosts, ports, and parameters are defined here as class variables.
 This enables easy modification without changing code throughout the library.
 """
 
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _warn_invalid_env(name: str, raw: str, default: float) -> None:
+    """Log that an environment override was ignored in favour of the default."""
+    from loguru import logger
+
+    logger.warning(f"Ignoring invalid {name}={raw!r}; using default {default}")
+
+
+def _env_positive(name: str, default: float) -> float:
+    """Read a positive number from the environment, falling back to default.
+
+    Malformed, non-finite or non-positive values are ignored with a warning
+    instead of failing client construction.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = 0.0
+    if 0 < value < float("inf"):
+        return value
+
+    _warn_invalid_env(name, raw, default)
+    return default
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Read a count of at least 1 from the environment, falling back to default.
+
+    Only whole numbers are accepted: truncating "0.5" would yield a pool of
+    zero connections, so fractions are ignored with a warning like any other
+    invalid value.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value >= 1:
+        return value
+
+    _warn_invalid_env(name, raw, default)
+    return default
+
+
+@lru_cache(maxsize=16)
+def _split_path_template(template: str, *fields: str) -> tuple[str, ...]:
+    """Split an endpoint template into the literal parts around its fields.
+
+    Args:
+        template: Endpoint template such as "/jobs/{job_id}"
+        fields: Placeholder names, in the order they appear in the template
+
+    Returns:
+        len(fields) + 1 literal parts
+
+    Raises:
+        ValueError: If a placeholder is missing or out of order
+    """
+    parts: list[str] = []
+    rest = template
+    for field in fields:
+        head, sep, rest = rest.partition(f"{{{field}}}")
+        if not sep:
+            raise ValueError(f"Endpoint template {template!r} lacks {{{field}}} in order")
+        parts.append(head)
+    parts.append(rest)
+    return tuple(parts)
+
 
 class ComputeClientConfig:
     """Configuration for compute client.
@@ -18,6 +100,13 @@ class ComputeClientConfig:
     DEFAULT_BASE_URL: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
     DEFAULT_TIMEOUT: float = 30.0
 
+    # HTTP Connection Pool (keep-alive reuse across sequential requests);
+    # sizes match httpx's own defaults so concurrent plugin submits are not capped
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+
     # MQTT Configuration
     MQTT_URL: str = "mqtt://localhost:1883"
 
@@ -30,6 +119,9 @@ class ComputeClientConfig:
     ENDPOINT_GET_JOB_FILE: str = "/jobs/{job_id}/files/{file_path}"
     ENDPOINT_CAPABILITIES: str = "/capabilities"
 
+    # File Downloads
+    DOWNLOAD_CHUNK_SIZE: int = 128 * 1024  # Bytes per streamed read (~100 KiB knee)
+
     # Plugin Endpoints (from cl_ml_tools)
     PLUGIN_ENDPOINTS: dict[str, str] = {
         "clip_embedding": "/jobs/clip_embedding",
@@ -47,11 +139,71 @@ class ComputeClientConfig:
     DEFAULT_POLL_INTERVAL: float = 1.0
     MAX_POLL_BACKOFF: float = 10.0
     POLL_BACKOFF_MULTIPLIER: float = 1.5
+    TERMINAL_JOB_STATUSES: frozenset[str] = frozenset({"completed", "failed"})
 
     # Worker Validation
     WORKER_WAIT_TIMEOUT: float = 30.0
     WORKER_CAPABILITY_CHECK_INTERVAL: float = 1.0
 
+    @classmethod
+    def http_limits(cls) -> httpx.Limits:
+        """Get connection pool limits for service HTTP clients.
+
+        Environment variables (override the class defaults):
+            CL_HTTPX_MAX_CONN: Max open connections (whole number, at least 1)
+            CL_HTTPX_MAX_KEEPALIVE: Max idle keep-alive connections (whole number, at least 1)
+            CL_HTTPX_KEEPALIVE_EXPIRY: Seconds an idle connection is kept
+
+        Values that are not positive numbers are ignored (with a warning).
+
+        Returns:
+            httpx.Limits for the connection pool
+        """
+        import httpx
+
+        return httpx.Limits(
+            max_connections=_env_positive_int("CL_HTTPX_MAX_CONN", cls.HTTP_MAX_CONNECTIONS),
+            max_keepalive_connections=_env_positive_int(
+                "CL_HTTPX_MAX_KEEPALIVE", cls.HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=_env_positive("CL_HTTPX_KEEPALIVE_EXPIRY", cls.HTTP_KEEPALIVE_EXPIRY),
+        )
+
+    @classmethod
+    def http2_enabled(cls) -> bool:
+        """Check whether HTTP/2 should be negotiated by service HTTP clients.
+
+        HTTP/2 needs the optional h2 package (``pip install cl-client[http2]``).
+        When it is installed, HTTP/2 is offered via TLS ALPN with HTTP/1.1 as
+        fallback, so concurrent requests can share one connection.
+
+        Environment variables:
+            CL_HTTPX_HTTP2: Set to "0" to keep HTTP/1.1 even if h2 is installed
+
+        Returns:
+            True if HTTP/2 should be enabled
+        """
+        if os.getenv("CL_HTTPX_HTTP2", "1") == "0":
+            return False
+
+        import importlib.util
+
+        return importlib.util.find_spec("h2") is not None
+
+    @classmethod
+    def http_timeout(cls, timeout: float) -> httpx.Timeout:
+        """Get request timeouts with a short connect phase.
+
+        Args:
+            timeout: Read/write/pool timeout in seconds
+
+        Returns:
+            httpx.Timeout whose connect timeout is capped at HTTP_CONNECT_TIMEOUT
+        """
+        import httpx
+
+        return httpx.Timeout(timeout, connect=min(timeout, cls.HTTP_CONNECT_TIMEOUT))
+
     @classmethod
     def get_plugin_endpoint(cls, task_type: str) -> str:
         """Get endpoint for plugin task type.
@@ -72,3 +224,38 @@ class ComputeClientConfig:
             )
             raise ValueError(msg)
         return cls.PLUGIN_ENDPOINTS[task_type]
+
+    @classmethod
+    def get_job_endpoint(cls, job_id: str) -> str:
+        """Get the job resource path used by get_job.
+
+        Same result as ENDPOINT_GET_JOB.format(job_id=...). The template is
+        split around its placeholder once (cached per template string), so
+        status polling only concatenates and still follows runtime changes
+        to ENDPOINT_GET_JOB.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Endpoint path
+        """
+        prefix, suffix = _split_path_template(cls.ENDPOINT_GET_JOB, "job_id")
+        return f"{prefix}{job_id}{suffix}"
+
+    @classmethod
+    def get_job_file_endpoint(cls, job_id: str, file_path: str) -> str:
+        """Get the path of a file in a job's output directory.
+
+        Same result as ENDPOINT_GET_JOB_FILE.format(job_id=..., file_path=...),
+        built from the split template like get_job_endpoint.
+
+        Args:
+            job_id: Job ID
+            file_path: Relative file path within job directory
+
+        Returns:
+            Endpoint path
+        """
+        head, middle, tail = _split_path_template(cls.ENDPOINT_GET_JOB_FILE, "job_id", "file_path")
+        return f"{head}{job_id}{middle}{file_path}{tail}"
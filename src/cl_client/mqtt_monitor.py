@@ -7,10 +7,12 @@ Provides real-time job status updates and worker capability tracking.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import threading
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import TypeVar, cast, overload
 
 import paho.mqtt.client as mqtt
 from loguru import logger
@@ -30,6 +32,8 @@ from .models import (
 _mqtt_registry: dict[str, tuple[MQTTJobMonitor, int]] = {}
 _registry_lock = threading.Lock()
 
+_T = TypeVar("_T")
+
 
 class JobEventPayload(BaseModel):
     job_id: str
@@ -83,20 +87,24 @@ class MQTTJobMonitor:
         self.port = parsed.port or 1883
 
         # Job subscriptions: subscription_id -> (job_id, on_progress, on_complete, task_type)
+        # Callbacks are stored normalized to plain calls (see _as_sync_callback)
         self._job_subscriptions: dict[
             str,
             tuple[
                 str,
-                Callable[[JobResponse], None]
-                | Callable[[JobResponse], Awaitable[None]]
-                | None,
-                Callable[[JobResponse], None]
-                | Callable[[JobResponse], Awaitable[None]]
-                | None,
+                Callable[[JobResponse], None] | None,
+                Callable[[JobResponse], None] | None,
                 str,
             ],
         ] = {}
 
+        # Job index: job_id -> subscription_ids (lets event dispatch skip unrelated jobs)
+        self._job_index: dict[str, set[str]] = {}
+
+        # Guards _job_subscriptions and _job_index: subscribers mutate them on the
+        # caller's thread while paho's network thread dispatches and auto-unsubscribes
+        self._job_lock: threading.Lock = threading.Lock()
+
         # Worker capability tracking
         self._workers: dict[str, WorkerCapability] = {}
         self._worker_callbacks: list[Callable[[str, WorkerCapability | None], None]] = (
@@ -106,7 +114,7 @@ class MQTTJobMonitor:
         # Entity subscriptions: subscription_id -> (entity_id, callback, topic)
         self._entity_subscriptions: dict[
             str,
-            tuple[int, Callable[[EntityStatusPayload], None] | Callable[[EntityStatusPayload], Awaitable[None]], str],
+            tuple[int, Callable[[EntityStatusPayload], None], str],
         ] = {}
 
         # Connection event for blocking until connected
@@ -223,17 +231,20 @@ class MQTTJobMonitor:
 
             updateMsg = JobEventPayload.model_validate_json(msg.payload.decode())
 
-            # Find matching subscriptions for this job
-            for _sub_id, (sub_job_id, on_progress, on_complete, task_type) in list(
-                self._job_subscriptions.items()
-            ):
-                if sub_job_id != updateMsg.job_id:
-                    continue
+            # Find matching subscriptions for this job (completed jobs are no longer
+            # indexed); snapshot under the lock, run callbacks outside it
+            with self._job_lock:
+                subscriptions = [
+                    (_sub_id, self._job_subscriptions[_sub_id])
+                    for _sub_id in self._job_index.get(updateMsg.job_id, ())
+                    if _sub_id in self._job_subscriptions
+                ]
+
+            for _sub_id, subscription in subscriptions:
+                _sub_job_id, on_progress, on_complete, task_type = subscription
 
                 # Create minimal JobResponse from event data
                 # Note: We don't have full job details from event, just status/progress
-                from .models import JobResponse
-
                 job = JobResponse(
                     job_id=updateMsg.job_id,
                     task_type=task_type,  # Use task_type from subscription
@@ -254,54 +265,27 @@ class MQTTJobMonitor:
                 )
 
                 # Call on_progress callback for any status update
+                # (callbacks were normalized to plain calls at subscribe time)
                 if on_progress:
                     try:
-                        # Support both sync and async callbacks
-                        import inspect
-
-                        if inspect.iscoroutinefunction(on_progress):
-                            # Schedule coroutine on event loop from MQTT thread
-                            if self._event_loop and self._event_loop.is_running():
-                                _ = asyncio.run_coroutine_threadsafe(
-                                    on_progress(job), self._event_loop
-                                )
-                            else:
-                                logger.warning(
-                                    "Event loop not available for async on_progress callback"
-                                )
-                        else:
-                            _ = on_progress(job)
+                        on_progress(job)
                     except Exception as e:
                         logger.error(
                             f"Error in on_progress callback: {e}", exc_info=True
                         )
 
                 # Call on_complete callback only for terminal states
-                if updateMsg.event_type in ["completed", "failed"] and on_complete:
+                is_terminal = updateMsg.event_type in ComputeClientConfig.TERMINAL_JOB_STATUSES
+                if is_terminal and on_complete:
                     try:
-                        # Support both sync and async callbacks
-                        import inspect
-
-                        if inspect.iscoroutinefunction(on_complete):
-                            # Schedule coroutine on event loop from MQTT thread
-                            if self._event_loop and self._event_loop.is_running():
-                                _ = asyncio.run_coroutine_threadsafe(
-                                    on_complete(job), self._event_loop
-                                )
-                            else:
-                                logger.warning(
-                                    "Event loop not available for async on_complete callback"
-                                )
-                        else:
-                            _ = on_complete(job)
+                        on_complete(job)
                     except Exception as e:
                         logger.error(
                             f"Error in on_complete callback: {e}", exc_info=True
                         )
                     finally:
                         # Auto-unsubscribe after on_complete fires to prevent memory leaks
-                        if _sub_id in self._job_subscriptions:
-                            del self._job_subscriptions[_sub_id]
+                        if self._remove_job_subscription(_sub_id) is not None:
                             logger.debug(f"Auto-unsubscribed from job {updateMsg.job_id} after completion")
 
         except (json.JSONDecodeError, KeyError, TypeError, ValidationError) as e:
@@ -322,14 +306,7 @@ class MQTTJobMonitor:
                     continue
 
                 try:
-                    import inspect
-                    if inspect.iscoroutinefunction(callback):
-                        if self._event_loop and self._event_loop.is_running():
-                            _ = asyncio.run_coroutine_threadsafe(
-                                callback(payload), self._event_loop
-                            )
-                    else:
-                        _ = callback(payload)
+                    callback(payload)
                 except Exception as e:
                     logger.error(f"Error in entity status callback: {e}", exc_info=True)
 
@@ -359,6 +336,53 @@ class MQTTJobMonitor:
                 except Exception as e:
                     logger.error(f"Error in worker callback: {e}", exc_info=True)
 
+    @overload
+    def _as_sync_callback(
+        self,
+        callback: Callable[[_T], None] | Callable[[_T], Awaitable[None]],
+        name: str,
+    ) -> Callable[[_T], None]: ...
+
+    @overload
+    def _as_sync_callback(
+        self,
+        callback: Callable[[_T], None] | Callable[[_T], Awaitable[None]] | None,
+        name: str,
+    ) -> Callable[[_T], None] | None: ...
+
+    def _as_sync_callback(
+        self,
+        callback: Callable[[_T], None] | Callable[[_T], Awaitable[None]] | None,
+        name: str,
+    ) -> Callable[[_T], None] | None:
+        """Normalize a sync or async callback into a plain call for the MQTT thread.
+
+        The coroutine check runs once at subscribe time instead of on every
+        message. Async callbacks are wrapped so each call schedules the
+        coroutine on the captured event loop.
+
+        Args:
+            callback: User callback (sync or async), or None
+            name: Callback name used in log messages
+
+        Returns:
+            Callable that can be invoked directly from the MQTT thread, or None
+        """
+        if callback is None or not inspect.iscoroutinefunction(callback):
+            return cast(Callable[[_T], None] | None, callback)
+
+        async_callback = cast(Callable[[_T], Coroutine[object, object, None]], callback)
+
+        def _schedule(arg: _T) -> None:
+            # Schedule coroutine on event loop from MQTT thread
+            loop = self._event_loop
+            if loop and loop.is_running():
+                _ = asyncio.run_coroutine_threadsafe(async_callback(arg), loop)
+            else:
+                logger.warning(f"Event loop not available for async {name} callback")
+
+        return _schedule
+
     def subscribe_job_updates(
         self,
         job_id: str,
@@ -394,17 +418,19 @@ class MQTTJobMonitor:
         # Generate unique subscription ID
         subscription_id = str(uuid.uuid4())
 
-        # Capture event loop for async callbacks (if not already captured)
-        if self._event_loop is None:
-            try:
-                self._event_loop = asyncio.get_running_loop()
-                logger.debug("Captured event loop for async MQTT callbacks")
-            except RuntimeError:
-                # No running loop yet, will be captured later or async callbacks will warn
-                pass
+        self._capture_event_loop()
+
+        subscription = (
+            job_id,
+            self._as_sync_callback(on_progress, "on_progress"),
+            self._as_sync_callback(on_complete, "on_complete"),
+            task_type,
+        )
 
         # Store subscription (no need to subscribe to MQTT - already subscribed to events topic)
-        self._job_subscriptions[subscription_id] = (job_id, on_progress, on_complete, task_type)
+        with self._job_lock:
+            self._job_subscriptions[subscription_id] = subscription
+            self._job_index.setdefault(job_id, set()).add(subscription_id)
 
         logger.debug(
             f"Registered callbacks for job {job_id} (sub_id: {subscription_id})"
@@ -412,6 +438,57 @@ class MQTTJobMonitor:
 
         return subscription_id
 
+    def subscribe_job_updates_batch(
+        self,
+        job_ids: list[str],
+        on_progress: OnJobResponseCallback = None,
+        on_complete: OnJobResponseCallback = None,
+        task_type: str = "unknown",
+    ) -> list[str]:
+        """Subscribe the same callbacks to updates for many jobs at once.
+
+        Equivalent to calling subscribe_job_updates for each job ID, but the
+        callbacks are normalized once and all subscriptions are registered in
+        a single update. Job events already arrive on one wildcard topic, so
+        no extra MQTT SUBSCRIBE packets are sent either way.
+
+        Args:
+            job_ids: Job IDs to monitor
+            on_progress: Called on each job update (queued → in_progress → ...)
+            on_complete: Called only when job completes (status: completed/failed)
+            task_type: Task type for the jobs (used to populate JobResponse)
+
+        Returns:
+            Subscription IDs, in the same order as job_ids
+        """
+        self._capture_event_loop()
+
+        progress_callback = self._as_sync_callback(on_progress, "on_progress")
+        complete_callback = self._as_sync_callback(on_complete, "on_complete")
+
+        subscription_ids = [str(uuid.uuid4()) for _ in job_ids]
+        with self._job_lock:
+            self._job_subscriptions.update(
+                (subscription_id, (job_id, progress_callback, complete_callback, task_type))
+                for subscription_id, job_id in zip(subscription_ids, job_ids)
+            )
+            for subscription_id, job_id in zip(subscription_ids, job_ids):
+                self._job_index.setdefault(job_id, set()).add(subscription_id)
+
+        logger.debug(f"Registered callbacks for {len(job_ids)} jobs")
+
+        return subscription_ids
+
+    def _capture_event_loop(self) -> None:
+        """Capture the running event loop for async callbacks, if not already captured."""
+        if self._event_loop is None:
+            try:
+                self._event_loop = asyncio.get_running_loop()
+                logger.debug("Captured event loop for async MQTT callbacks")
+            except RuntimeError:
+                # No running loop yet, will be captured later or async callbacks will warn
+                pass
+
     def subscribe_entity_status(
         self,
         entity_id: int,
@@ -430,12 +507,7 @@ class MQTTJobMonitor:
         """
         subscription_id = str(uuid.uuid4())
 
-        # Capture event loop
-        if self._event_loop is None:
-            try:
-                self._event_loop = asyncio.get_running_loop()
-            except RuntimeError:
-                pass
+        self._capture_event_loop()
 
         # Subscribe to MQTT topic
         topic = f"mInsight/{store_port}/entity_item_status/{entity_id}"
@@ -443,7 +515,11 @@ class MQTTJobMonitor:
         logger.debug(f"Subscribed to entity status: {topic}")
 
         # Store subscription with topic for cleanup
-        self._entity_subscriptions[subscription_id] = (entity_id, on_update, topic)
+        self._entity_subscriptions[subscription_id] = (
+            entity_id,
+            self._as_sync_callback(on_update, "entity status"),
+            topic,
+        )
 
         return subscription_id
 
@@ -462,15 +538,33 @@ class MQTTJobMonitor:
         Args:
             subscription_id: Subscription ID returned from subscribe_job_updates()
         """
-        if subscription_id not in self._job_subscriptions:
+        job_id = self._remove_job_subscription(subscription_id)
+        if job_id is None:
             logger.warning(f"Subscription not found: {subscription_id}")
             return
 
-        job_id, *_ = self._job_subscriptions[subscription_id]
-        del self._job_subscriptions[subscription_id]
-
         logger.debug(f"Removed callbacks for job {job_id} (sub_id: {subscription_id})")
 
+    def _remove_job_subscription(self, subscription_id: str) -> str | None:
+        """Remove a job subscription and its index entry.
+
+        Returns:
+            Job ID of the removed subscription, or None if it was not registered
+        """
+        with self._job_lock:
+            subscription = self._job_subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return None
+
+            job_id = subscription[0]
+            sub_ids = self._job_index.get(job_id)
+            if sub_ids is not None:
+                sub_ids.discard(subscription_id)
+                if not sub_ids:
+                    del self._job_index[job_id]
+
+        return job_id
+
     def get_worker_capabilities(self) -> dict[str, WorkerCapability]:
         """Get current worker capabilities (synchronous, from cached state)."""
         return self._workers.copy()
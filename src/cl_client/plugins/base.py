@@ -90,8 +90,8 @@ class BasePluginClient:
             JobResponse with job details
         """
 
-        # Submit job (accessing protected _session is intentional for plugin clients)
-        job_id = await self.client.http_submit_job(  # type: ignore[reportPrivateUsage]
+        # Submit job through the owning client, which reuses its single HTTP pool
+        job_id = await self.client.http_submit_job(
             self.endpoint,
             files=None,
             data=HttpUtils.build_form_data(params, priority),
@@ -170,8 +170,8 @@ class BasePluginClient:
         # Prepare form data
         multipart = HttpUtils.open_multipart_files(files)
         try:
-            # Submit job (accessing protected _session is intentional for plugin clients)
-            job_id = await self.client.http_submit_job(  # type: ignore[reportPrivateUsage]
+            # Submit job through the owning client, which reuses its single HTTP pool
+            job_id = await self.client.http_submit_job(
                 self.endpoint,
                 files=multipart,  # type: ignore[arg-type]
                 data=HttpUtils.build_form_data(params, priority),
@@ -66,12 +66,12 @@ class ServerPref:
             config = ServerPref.from_env()
             print(config.auth_url)  # https://auth.prod.example.com
         """
-        # Get default instance for fallback values
-        default = cls()
-
+        # Field defaults are class attributes on the dataclass; read them directly
+        # rather than building a throwaway default instance. A fresh instance is
+        # returned on every call because ServerPref is mutable.
         return cls(
-            auth_url=os.getenv("AUTH_URL", default.auth_url),
-            compute_url=os.getenv("COMPUTE_URL", default.compute_url),
-            store_url=os.getenv("STORE_URL", default.store_url),
-            mqtt_url=os.getenv("MQTT_URL", default.mqtt_url),
+            auth_url=os.getenv("AUTH_URL", cls.auth_url),
+            compute_url=os.getenv("COMPUTE_URL", cls.compute_url),
+            store_url=os.getenv("STORE_URL", cls.store_url),
+            mqtt_url=os.getenv("MQTT_URL", cls.mqtt_url),
         )
@@ -30,6 +30,19 @@ from cl_client.intelligence_models import (
     KnownPersonResponse,
 )
 
+# Built once at import; constructing a TypeAdapter per call rebuilds its validator
+_ENTITY_VERSION_LIST_ADAPTER: TypeAdapter[list[EntityVersion]] = TypeAdapter(list[EntityVersion])
+_FACE_LIST_ADAPTER: TypeAdapter[list[FaceResponse]] = TypeAdapter(list[FaceResponse])
+_ENTITY_JOB_LIST_ADAPTER: TypeAdapter[list[EntityJobResponse]] = TypeAdapter(
+    list[EntityJobResponse]
+)
+_KNOWN_PERSON_LIST_ADAPTER: TypeAdapter[list[KnownPersonResponse]] = TypeAdapter(
+    list[KnownPersonResponse]
+)
+_INTELLIGENCE_ADAPTER: TypeAdapter[EntityIntelligenceData | None] = TypeAdapter(
+    EntityIntelligenceData | None
+)
+
 
 class StoreClient:
     """Low-level HTTP client for store service operations.
@@ -117,7 +130,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return RootResponse.model_validate(response.json())
+        return RootResponse.model_validate_json(response.content)
 
     # Read operations (use query parameters)
 
@@ -211,7 +224,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return EntityListResponse.model_validate(response.json())
+        return EntityListResponse.model_validate_json(response.content)
 
     async def lookup_entity(
         self,
@@ -249,7 +262,7 @@ class StoreClient:
             return None
 
         _ = response.raise_for_status()
-        return Entity.model_validate(response.json())
+        return Entity.model_validate_json(response.content)
 
     # Multimedia operations
 
@@ -338,7 +351,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return Entity.model_validate(response.json())
+        return Entity.model_validate_json(response.content)
 
     async def get_versions(self, entity_id: int) -> list[EntityVersion]:
         """Get version history for an entity.
@@ -360,8 +373,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        adapter = TypeAdapter(list[EntityVersion])
-        return adapter.validate_python(response.json())
+        return _ENTITY_VERSION_LIST_ADAPTER.validate_json(response.content)
 
     # Write operations
 
@@ -415,7 +427,7 @@ class StoreClient:
                 headers=await self._get_headers(),
             )
             _ = response.raise_for_status()
-            return Entity.model_validate(response.json())
+            return Entity.model_validate_json(response.content)
         finally:
             if opened_files:
                 HttpUtils.close_multipart_files(opened_files)
@@ -471,7 +483,7 @@ class StoreClient:
                 headers=await self._get_headers(),
             )
             _ = response.raise_for_status()
-            return Entity.model_validate(response.json())
+            return Entity.model_validate_json(response.content)
         finally:
             if opened_files:
                 HttpUtils.close_multipart_files(opened_files)
@@ -575,7 +587,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return Entity.model_validate(response.json())
+        return Entity.model_validate_json(response.content)
 
         response = await self._client.patch(
             f"{self._base_url}/entities/{entity_id}",
@@ -583,7 +595,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return Entity.model_validate(response.json())
+        return Entity.model_validate_json(response.content)
 
     async def delete_entity(self, entity_id: int) -> None:
         """Hard delete an entity.
@@ -660,7 +672,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return AuditReport.model_validate(response.json())
+        return AuditReport.model_validate_json(response.content)
 
     async def clear_orphans(self) -> CleanupReport:
         """Remove all orphaned resources identified by the audit system.
@@ -678,7 +690,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return CleanupReport.model_validate(response.json())
+        return CleanupReport.model_validate_json(response.content)
 
     # Admin operations
 
@@ -699,7 +711,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return StorePref.model_validate(response.json())
+        return StorePref.model_validate_json(response.content)
 
     async def update_guest_mode(self, guest_mode: bool) -> StorePref:
         """Update guest mode setting (admin only).
@@ -766,10 +778,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        data = response.json()
-        if data is None:
-            return None
-        return EntityIntelligenceData.model_validate(data)
+        return _INTELLIGENCE_ADAPTER.validate_json(response.content)
 
     async def get_entity_faces(self, entity_id: int) -> list[FaceResponse]:
         """Get all faces detected in an entity.
@@ -791,8 +800,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        adapter = TypeAdapter(list[FaceResponse])
-        return adapter.validate_python(response.json())
+        return _FACE_LIST_ADAPTER.validate_json(response.content)
 
     async def get_entity_jobs(self, entity_id: int) -> list[EntityJobResponse]:
         """Get all compute jobs for an entity.
@@ -814,8 +822,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        adapter = TypeAdapter(list[EntityJobResponse])
-        return adapter.validate_python(response.json())
+        return _ENTITY_JOB_LIST_ADAPTER.validate_json(response.content)
     
     async def download_entity_clip_embedding(self, entity_id: int) -> bytes:
         """Download entity CLIP embedding as .npy bytes.
@@ -900,8 +907,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        adapter = TypeAdapter(list[KnownPersonResponse])
-        return adapter.validate_python(response.json())
+        return _KNOWN_PERSON_LIST_ADAPTER.validate_json(response.content)
 
     async def get_known_person(self, person_id: int) -> KnownPersonResponse:
         """Get known person details.
@@ -923,7 +929,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return KnownPersonResponse.model_validate(response.json())
+        return KnownPersonResponse.model_validate_json(response.content)
 
     async def get_person_faces(self, person_id: int) -> list[FaceResponse]:
         """Get all faces associated with a known person.
@@ -945,8 +951,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        adapter = TypeAdapter(list[FaceResponse])
-        return adapter.validate_python(response.json())
+        return _FACE_LIST_ADAPTER.validate_json(response.content)
 
 
 
@@ -973,7 +978,7 @@ class StoreClient:
             headers=await self._get_headers(),
         )
         _ = response.raise_for_status()
-        return KnownPersonResponse.model_validate(response.json())
+        return KnownPersonResponse.model_validate_json(response.content)
 
 
 
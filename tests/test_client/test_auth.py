@@ -2,10 +2,13 @@
 
 import base64
 import json
+import time
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
+from cl_client import auth as auth_module
 from cl_client.auth import (
     AuthProvider,
     JWTAuthProvider,
@@ -41,6 +44,14 @@ def test_get_default_auth():
     assert provider.get_headers() == {}
 
 
+def test_get_default_auth_is_shared():
+    """Test get_default_auth reuses one stateless provider and header dict."""
+    provider = get_default_auth()
+
+    assert get_default_auth() is provider
+    assert provider.get_headers() is NoAuthProvider().get_headers()
+
+
 def test_auth_provider_is_abstract():
     """Test that AuthProvider cannot be instantiated directly."""
     with pytest.raises(TypeError):
@@ -287,6 +298,42 @@ class TestTokenExpiryChecking:
         provider = JWTAuthProvider(token=token)
         assert provider.should_refresh(token) is True
 
+    def test_should_refresh_parses_each_token_once(self):
+        """Test that repeated checks of the same token reuse the parsed expiry."""
+        expiry_time = datetime.now(UTC) + timedelta(minutes=5)
+        token = _create_jwt_token({"sub": "cache-user", "exp": int(expiry_time.timestamp())})
+        new_token = _create_jwt_token({"sub": "cache-user", "exp": int(expiry_time.timestamp()) + 1})
+
+        provider = JWTAuthProvider(token=token)
+        with patch("cl_client.auth._parse_exp", wraps=auth_module._parse_exp) as mock_parse:
+            for _ in range(5):
+                assert provider.should_refresh(token) is False
+            assert mock_parse.call_count == 1
+
+            # A new token is parsed again and replaces the cached one
+            assert provider.should_refresh(new_token) is False
+            assert mock_parse.call_count == 2
+
+    def test_parse_token_expiry_out_of_range_exp(self):
+        """Test that an exp outside the datetime range is treated as missing."""
+        token = _create_jwt_token({"sub": "user123", "exp": 1e20})
+
+        provider = JWTAuthProvider(token=token)
+        assert provider._parse_token_expiry(token) is None
+
+    def test_should_refresh_cached_token_crosses_threshold(self):
+        """Test that caching the expiry does not cache the refresh decision."""
+        expiry_time = datetime.now(UTC) + timedelta(minutes=5)
+        token = _create_jwt_token({"sub": "user123", "exp": int(expiry_time.timestamp())})
+
+        provider = JWTAuthProvider(token=token)
+        assert provider.should_refresh(token) is False
+
+        # Four and a half minutes later the same (cached) token is inside the window
+        later = time.time() + 270
+        with patch("cl_client.auth.time.time", return_value=later):
+            assert provider.should_refresh(token) is True
+
 
 class TestJWTAuthProviderGetHeaders:
     """Tests for JWTAuthProvider.get_headers() method."""
@@ -299,6 +346,19 @@ class TestJWTAuthProviderGetHeaders:
         assert "Authorization" in headers
         assert headers["Authorization"] == "Bearer my-test-token"
 
+    def test_get_headers_reused_until_token_changes(self):
+        """Test get_headers() rebuilds the header only when the token changes."""
+        tokens = ["token-a", "token-a", "token-b"]
+        provider = JWTAuthProvider(get_cached_token=lambda: tokens.pop(0))
+
+        first = provider.get_headers()
+        second = provider.get_headers()
+        third = provider.get_headers()
+
+        assert first is second
+        assert third == {"Authorization": "Bearer token-b"}
+        assert third is not first
+
     def test_get_headers_no_token_raises_error(self):
         """Test get_headers() raises error when no token available."""
         # This would require a mock SessionManager without a token
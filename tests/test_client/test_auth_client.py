@@ -1,5 +1,7 @@
 """Tests for AuthClient."""
 
+import asyncio
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -15,6 +17,7 @@ from cl_client.auth_models import (
     UserResponse,
     UserUpdateRequest,
 )
+from cl_client.config import ComputeClientConfig
 from cl_client.server_pref import ServerPref
 
 
@@ -59,6 +62,71 @@ class TestAuthClientInit:
 
         assert client.timeout == 60.0
 
+    def test_auth_client_default_limits(self):
+        """Test AuthClient builds its pool with the configured keep-alive limits."""
+        with patch("cl_client.auth_client.httpx.AsyncClient") as mock_client_class:
+            client = AuthClient()
+
+        assert client.limits == httpx.Limits(
+            max_connections=ComputeClientConfig.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=ComputeClientConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=ComputeClientConfig.HTTP_KEEPALIVE_EXPIRY,
+        )
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["limits"] is client.limits
+        assert kwargs["http2"] == ComputeClientConfig.http2_enabled()
+        # A custom transport would make httpx ignore proxy environment variables
+        assert "transport" not in kwargs
+
+    def test_auth_client_custom_limits(self):
+        """Test AuthClient passes custom pool limits to its HTTP client."""
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        with patch("cl_client.auth_client.httpx.AsyncClient") as mock_client_class:
+            client = AuthClient(limits=limits)
+
+        assert client.limits is limits
+        assert mock_client_class.call_args.kwargs["limits"] is limits
+
+    def test_auth_client_honours_proxy_env(self, monkeypatch: pytest.MonkeyPatch):
+        """Test proxy environment variables still apply to the auth session."""
+        monkeypatch.setenv("HTTP_PROXY", "http://proxy.test:3128")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+
+        client = AuthClient(base_url="http://auth.test")
+
+        transport = client._session._transport_for_url(httpx.URL("http://auth.test/"))
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        assert transport is not client._session._transport
+
+    def test_auth_client_caps_connect_timeout(self):
+        """Test AuthClient fails fast on connect while keeping the request timeout."""
+        client = AuthClient(timeout=60.0)
+
+        assert client._session.timeout == httpx.Timeout(
+            60.0, connect=ComputeClientConfig.HTTP_CONNECT_TIMEOUT
+        )
+
+    @pytest.mark.asyncio
+    async def test_auth_client_bearer_cache_is_per_client(self):
+        """Test the Authorization header cache is scoped to the client and token."""
+        client = AuthClient()
+        other = AuthClient()
+
+        first = client._bearer("token-a")
+        assert client._bearer("token-a") is first
+        assert first["Authorization"] == "Bearer token-a"
+        assert other._bearer("token-a") is not first
+
+        # A rotated token replaces the cached one instead of accumulating
+        assert client._bearer("token-b")["Authorization"] == "Bearer token-b"
+        assert client._bearer_cache is not None
+        assert client._bearer_cache[0] == "token-b"
+
+        await client.close()
+        await other.close()
+        assert client._bearer_cache is None
+
 
 class TestAuthClientTokenManagement:
     """Tests for AuthClient token management endpoints."""
@@ -67,10 +135,10 @@ class TestAuthClientTokenManagement:
     async def test_login_success(self):
         """Test successful login."""
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "access_token": "test_token_abc123",
             "token_type": "bearer",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -112,7 +180,7 @@ class TestAuthClientTokenManagement:
     async def test_login_invalid_response_type(self):
         """Test login with invalid response type (Pydantic validation)."""
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = ["not", "a", "dict"]  # Invalid type
+        mock_response.content = json.dumps(["not", "a", "dict"]).encode()  # Invalid type
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -128,10 +196,10 @@ class TestAuthClientTokenManagement:
     async def test_refresh_token_success(self):
         """Test successful token refresh."""
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "access_token": "new_token_xyz789",
             "token_type": "bearer",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -173,10 +241,10 @@ class TestAuthClientTokenManagement:
     async def test_get_public_key_success(self):
         """Test successful public key retrieval."""
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "public_key": "-----BEGIN PUBLIC KEY-----\ntest_key\n-----END PUBLIC KEY-----",
             "algorithm": "ES256",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -201,14 +269,14 @@ class TestAuthClientUserInfo:
         """Test successful get current user."""
         now = datetime.now(UTC)
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 1,
             "username": "testuser",
             "is_admin": False,
             "is_active": True,
             "created_at": now.isoformat(),
             "permissions": ["read:jobs", "write:jobs"],
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -258,14 +326,14 @@ class TestAuthClientAdminUserManagement:
         """Test successful user creation."""
         now = datetime.now(UTC)
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 2,
             "username": "newuser",
             "is_admin": False,
             "is_active": True,
             "created_at": now.isoformat(),
             "permissions": ["read:jobs"],
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -359,7 +427,7 @@ class TestAuthClientAdminUserManagement:
         """Test successful user listing."""
         now = datetime.now(UTC)
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "id": 1,
                 "username": "user1",
@@ -376,7 +444,7 @@ class TestAuthClientAdminUserManagement:
                 "created_at": now.isoformat(),
                 "permissions": ["*"],
             },
-        ]
+        ]).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -428,7 +496,7 @@ class TestAuthClientAdminUserManagement:
     async def test_list_users_invalid_response_type(self):
         """Test list users with invalid response type (Pydantic validation)."""
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {"not": "a list"}  # Invalid type
+        mock_response.content = json.dumps({"not": "a list"}).encode()  # Invalid type
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -437,7 +505,7 @@ class TestAuthClientAdminUserManagement:
             mock_get.return_value = mock_response
 
             async with AuthClient() as client:
-                # Iterating over dict keys, Pydantic will raise ValidationError
+                # A JSON object is not a list, so Pydantic raises ValidationError
                 with pytest.raises(ValidationError):
                     await client.list_users(token="admin_token")
 
@@ -447,14 +515,14 @@ class TestAuthClientAdminUserManagement:
         """Test successful get user by ID."""
         now = datetime.now(UTC)
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 2,
             "username": "targetuser",
             "is_admin": False,
             "is_active": True,
             "created_at": now.isoformat(),
             "permissions": ["read:jobs", "write:jobs"],
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -473,6 +541,106 @@ class TestAuthClientAdminUserManagement:
             assert result.id == 2
             assert result.username == "targetuser"
 
+    @pytest.mark.asyncio
+    @pytest.mark.admin_only
+    async def test_get_users_concurrent(self):
+        """Test get_users fetches every ID and keeps the requested order."""
+        now = datetime.now(UTC)
+
+        def _user_response(user_id: int) -> Mock:
+            response = Mock(spec=httpx.Response)
+            response.content = json.dumps({
+                "id": user_id,
+                "username": f"user{user_id}",
+                "created_at": now.isoformat(),
+            }).encode()
+            response.raise_for_status = Mock()
+            return response
+
+        async def _get(url: str, headers: httpx.Headers) -> Mock:
+            return _user_response(int(url.rsplit("/", 1)[1]))
+
+        with patch.object(
+            httpx.AsyncClient, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.side_effect = _get
+
+            async with AuthClient() as client:
+                result = await client.get_users(token="admin_token", user_ids=[5, 2, 9])
+
+            assert mock_get.call_count == 3
+            assert [user.id for user in result] == [5, 2, 9]
+            assert result[1].username == "user2"
+            sent = [call.kwargs["headers"] for call in mock_get.call_args_list]
+            assert isinstance(sent[0], httpx.Headers)
+            assert all(headers is sent[0] for headers in sent)
+
+    @pytest.mark.asyncio
+    @pytest.mark.admin_only
+    async def test_get_users_bounded_by_pool_limit(self):
+        """Test get_users keeps at most max_connections lookups in flight."""
+        now = datetime.now(UTC)
+        in_flight = 0
+        peak = 0
+
+        async def _get(url: str, headers: httpx.Headers) -> Mock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock(spec=httpx.Response)
+            response.content = json.dumps({
+                "id": int(url.rsplit("/", 1)[1]),
+                "username": "user",
+                "created_at": now.isoformat(),
+            }).encode()
+            response.raise_for_status = Mock()
+            return response
+
+        with patch.object(
+            httpx.AsyncClient, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.side_effect = _get
+
+            limits = httpx.Limits(max_connections=2, max_keepalive_connections=2)
+            async with AuthClient(limits=limits) as client:
+                result = await client.get_users(token="admin_token", user_ids=range(6))
+
+        assert [user.id for user in result] == list(range(6))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.admin_only
+    async def test_get_users_cancels_pending_on_failure(self):
+        """Test the first failed lookup cancels the lookups still in flight."""
+        cancelled: list[int] = []
+
+        async def _get(url: str, headers: httpx.Headers) -> Mock:
+            user_id = int(url.rsplit("/", 1)[1])
+            if user_id == 1:
+                request = httpx.Request("GET", url)
+                response = httpx.Response(404, request=request)
+                raise httpx.HTTPStatusError("not found", request=request, response=response)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(user_id)
+                raise
+            raise AssertionError("lookup should have been cancelled")
+
+        with patch.object(
+            httpx.AsyncClient, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.side_effect = _get
+
+            async with AuthClient() as client:
+                with pytest.raises(httpx.HTTPStatusError):
+                    _ = await client.get_users(token="admin_token", user_ids=[2, 1, 3])
+                await asyncio.sleep(0)
+
+        assert sorted(cancelled) == [2, 3]
+
     @pytest.mark.asyncio
     @pytest.mark.admin_only
     async def test_get_user_not_found(self):
@@ -499,14 +667,14 @@ class TestAuthClientAdminUserManagement:
         """Test successful user update."""
         now = datetime.now(UTC)
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 2,
             "username": "updateduser",
             "is_admin": True,
             "is_active": True,
             "created_at": now.isoformat(),
             "permissions": ["*"],
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -544,14 +712,14 @@ class TestAuthClientAdminUserManagement:
         """Test partial user update (only password)."""
         now = datetime.now(UTC)
         mock_response = Mock(spec=httpx.Response)
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 2,
             "username": "user",
             "is_admin": False,
             "is_active": True,
             "created_at": now.isoformat(),
             "permissions": [],
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
 
         with patch.object(
@@ -660,6 +828,23 @@ class TestAuthClientAdminUserManagement:
                 with pytest.raises(httpx.HTTPStatusError):
                     await client.delete_user(token="non_admin_token", user_id=2)
 
+    @pytest.mark.asyncio
+    async def test_delete_user_redirect_raises(self):
+        """Test a 3xx response is an error, not a silent success."""
+        request = httpx.Request("DELETE", "http://auth.test/users/2")
+        redirect = httpx.Response(
+            307, headers={"Location": "/users/2/"}, request=request
+        )
+
+        with patch.object(
+            httpx.AsyncClient, "delete", new_callable=AsyncMock
+        ) as mock_delete:
+            mock_delete.return_value = redirect
+
+            async with AuthClient() as client:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await client.delete_user(token="admin_token", user_id=2)
+
 
 class TestAuthClientContextManager:
     """Tests for AuthClient async context manager."""
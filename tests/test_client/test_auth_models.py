@@ -48,6 +48,15 @@ class TestTokenResponse:
         with pytest.raises(ValidationError):
             TokenResponse(access_token="test_token")  # type: ignore[call-arg]
 
+    def test_token_response_is_frozen(self):
+        """Test TokenResponse instances cannot be modified after parsing."""
+        token = TokenResponse(access_token="test_token", token_type="bearer")
+
+        with pytest.raises(ValidationError):
+            token.access_token = "other"  # type: ignore[misc]
+
+        assert hash(token) == hash(TokenResponse(access_token="test_token", token_type="bearer"))
+
 
 class TestPublicKeyResponse:
     """Tests for PublicKeyResponse model."""
@@ -201,6 +210,27 @@ class TestUserCreateRequest:
         assert data["password"] == "testpass"
         assert data["permissions"] == ["read:jobs", "write:jobs"]
 
+    def test_user_create_request_rejects_unknown_fields(self):
+        """Test UserCreateRequest rejects misspelled or unknown fields."""
+        with pytest.raises(ValidationError):
+            UserCreateRequest(username="testuser", password="testpass", is_admn=True)  # type: ignore[call-arg]
+
+    def test_user_create_request_to_api_payload(self):
+        """Test UserCreateRequest form payload stringifies every field."""
+        request = UserCreateRequest(
+            username="testuser",
+            password="testpass",
+            permissions=["read:jobs", "write:jobs"],
+        )
+
+        assert request.to_api_payload() == {
+            "username": "testuser",
+            "password": "testpass",
+            "is_admin": "false",
+            "is_active": "true",
+            "permissions": "read:jobs,write:jobs",
+        }
+
 
 class TestUserUpdateRequest:
     """Tests for UserUpdateRequest model."""
@@ -255,3 +285,9 @@ class TestUserUpdateRequest:
         assert "is_admin" in data
         assert "permissions" not in data
         assert "is_active" not in data
+
+    def test_user_update_request_to_api_payload_skips_none(self):
+        """Test UserUpdateRequest form payload only carries provided fields."""
+        request = UserUpdateRequest(permissions=["*"], is_admin=True)
+
+        assert request.to_api_payload() == {"permissions": "*", "is_admin": "true"}
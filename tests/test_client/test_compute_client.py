@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generator, cast
+import asyncio
+import json
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, Generator, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -9,7 +12,7 @@ import pytest
 from cl_client.auth import JWTAuthProvider, NoAuthProvider
 from cl_client.compute_client import ComputeClient
 from cl_client.config import ComputeClientConfig
-from cl_client.exceptions import WorkerUnavailableError
+from cl_client.exceptions import ComputeClientError, WorkerUnavailableError
 from cl_client.models import JobResponse
 from cl_client.server_pref import ServerPref
 
@@ -68,6 +71,63 @@ def test_init_with_custom_parameters(mock_mqtt_monitor: MagicMock, mock_httpx_cl
     assert client.auth == auth
 
 
+def test_init_uses_configured_pool_limits(
+    mock_mqtt_monitor: MagicMock, mock_httpx_client: AsyncMock
+) -> None:
+    """Test client passes the configured keep-alive pool limits to its HTTP client."""
+    with patch("cl_client.compute_client.httpx.AsyncClient") as mock_client_class:
+        client = ComputeClient()
+
+    assert client.limits == httpx.Limits(
+        max_connections=ComputeClientConfig.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=ComputeClientConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=ComputeClientConfig.HTTP_KEEPALIVE_EXPIRY,
+    )
+    kwargs = mock_client_class.call_args.kwargs
+    assert kwargs["limits"] is client.limits
+    assert kwargs["http2"] == ComputeClientConfig.http2_enabled()
+    # A custom transport would make httpx ignore proxy environment variables
+    assert "transport" not in kwargs
+
+
+def test_init_with_custom_limits(mock_mqtt_monitor: MagicMock, mock_httpx_client: AsyncMock) -> None:
+    """Test client accepts custom connection pool limits."""
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+
+    client = ComputeClient(limits=limits)
+
+    assert client.limits is limits
+
+
+@pytest.mark.asyncio
+async def test_auth_flow_applies_current_provider_headers(mock_mqtt_monitor: MagicMock) -> None:
+    """Test every request carries the auth provider's current token."""
+    seen: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"num_workers": 0, "capabilities": {}})
+
+    tokens = ["token-a"]
+    auth = JWTAuthProvider(get_cached_token=lambda: tokens[-1])
+    client = ComputeClient(base_url="http://compute.test", auth_provider=auth)
+    # Keep the client's auth flow but route requests to an in-memory handler
+    client._session = httpx.AsyncClient(
+        base_url=client.base_url,
+        auth=client._session.auth,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    _ = await client.get_capabilities()
+    tokens.append("token-b")  # e.g. SessionManager refreshed the JWT
+    _ = await client.get_capabilities()
+    client.auth = NoAuthProvider()
+    _ = await client.get_capabilities()
+    await client._session.aclose()
+
+    assert seen == ["Bearer token-a", "Bearer token-b", None]
+
+
 def test_init_with_server_pref(mock_mqtt_monitor: MagicMock, mock_httpx_client: AsyncMock) -> None:
     """Test client initialization with ServerPref."""
     config = ServerPref(
@@ -123,7 +183,7 @@ async def test_get_job_success(client: ComputeClient, mock_httpx_client: AsyncMo
     }
 
     mock_response = MagicMock()
-    mock_response.json.return_value = job_data
+    mock_response.content = json.dumps(job_data).encode()
     mock_httpx_client.get.return_value = mock_response
 
     job = await client.get_job("test-123")
@@ -134,7 +194,7 @@ async def test_get_job_success(client: ComputeClient, mock_httpx_client: AsyncMo
 
     # Verify correct endpoint was called
     expected_endpoint = ComputeClientConfig.ENDPOINT_GET_JOB.format(job_id="test-123")
-    _ = cast(Any, mock_httpx_client.get).assert_called_once_with(expected_endpoint, headers={})
+    _ = cast(Any, mock_httpx_client.get).assert_called_once_with(expected_endpoint)
     _ = cast(Any, mock_response.raise_for_status).assert_called_once()
 
 
@@ -144,7 +204,7 @@ async def test_get_job_invalid_response(
 ) -> None:
     """Test get_job raises error on invalid response format."""
     mock_response = MagicMock()
-    mock_response.json.return_value = "not a dict"  # Invalid format
+    mock_response.content = json.dumps("not a dict").encode()  # Invalid format
     mock_httpx_client.get.return_value = mock_response
 
     from pydantic import ValidationError
@@ -155,6 +215,162 @@ async def test_get_job_invalid_response(
     assert "1 validation error" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_get_job_coalesces_concurrent_calls(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test concurrent get_job calls for one job share a single request."""
+    release = asyncio.Event()
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(
+        {
+            "job_id": "test-123",
+            "task_type": "clip_embedding",
+            "status": "processing",
+            "created_at": 1234567890,
+        }
+    ).encode()
+
+    async def slow_get(endpoint: str) -> MagicMock:
+        _ = endpoint
+        await release.wait()
+        return mock_response
+
+    mock_httpx_client.get.side_effect = slow_get
+
+    first = asyncio.ensure_future(client.get_job("test-123"))
+    second = asyncio.ensure_future(client.get_job("test-123"))
+    await asyncio.sleep(0)
+    release.set()
+    jobs = await asyncio.gather(first, second)
+
+    assert jobs[0] is jobs[1]
+    assert mock_httpx_client.get.call_count == 1
+    assert client._inflight_jobs == {}
+
+    # A later call is a fresh request, not a cached result
+    _ = await client.get_job("test-123")
+    assert mock_httpx_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_job_fresh_bypasses_inflight_request(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test fresh=True does not join a request sent before a known state change."""
+    release_stale = asyncio.Event()
+
+    def _response(status: str) -> MagicMock:
+        response = MagicMock()
+        response.content = json.dumps(
+            {
+                "job_id": "test-123",
+                "task_type": "clip_embedding",
+                "status": status,
+                "created_at": 1234567890,
+            }
+        ).encode()
+        return response
+
+    async def get(endpoint: str) -> MagicMock:
+        _ = endpoint
+        # The first request is sent before the job finished and answers late
+        if mock_httpx_client.get.call_count == 1:
+            await release_stale.wait()
+            return _response("processing")
+        return _response("completed")
+
+    mock_httpx_client.get.side_effect = get
+
+    stale = asyncio.ensure_future(client.get_job("test-123"))
+    await asyncio.sleep(0)
+    fresh = asyncio.ensure_future(client.get_job("test-123", fresh=True))
+    await asyncio.sleep(0)
+    # A plain call now joins the fresh request rather than the stale one
+    joined = asyncio.ensure_future(client.get_job("test-123"))
+
+    assert (await fresh).status == "completed"
+    assert (await joined).status == "completed"
+    release_stale.set()
+    assert (await stale).status == "processing"
+    assert mock_httpx_client.get.call_count == 2
+    assert client._inflight_jobs == {}
+
+
+@pytest.mark.asyncio
+async def test_get_job_error_retrieved_when_callers_cancelled(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test a failed shared request is not reported as an unretrieved exception."""
+    import gc
+
+    release = asyncio.Event()
+
+    async def failing_get(endpoint: str) -> MagicMock:
+        _ = endpoint
+        await release.wait()
+        raise httpx.ConnectError("boom")
+
+    mock_httpx_client.get.side_effect = failing_get
+
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    try:
+        caller = asyncio.ensure_future(client.get_job("test-123"))
+        await asyncio.sleep(0)
+        shared = client._inflight_jobs["test-123"]
+        _ = caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        release.set()
+        while not shared.done():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        del shared, caller
+        _ = gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert client._inflight_jobs == {}
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_http_submit_job_returns_job_id(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test http_submit_job validates the creation response and returns its job ID."""
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(
+        {"job_id": "job-456", "status": "queued", "task_type": "exif"}
+    ).encode()
+    mock_httpx_client.post.return_value = mock_response
+
+    job_id = await client.http_submit_job("/jobs/exif", data={"priority": "5"}, files=None)
+
+    assert job_id == "job-456"
+    _ = cast(Any, mock_httpx_client.post).assert_called_once_with(
+        "/jobs/exif", files=None, data={"priority": "5"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_http_submit_job_rejects_non_object_body(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test http_submit_job lets pydantic reject a body that is not an object."""
+    from pydantic import ValidationError
+
+    mock_response = MagicMock()
+    mock_response.content = b'["job-456"]'
+    mock_httpx_client.post.return_value = mock_response
+
+    with pytest.raises(ValidationError):
+        await client.http_submit_job("/jobs/exif", data=None, files=None)
+
+
 @pytest.mark.asyncio
 async def test_delete_job_success(client: ComputeClient, mock_httpx_client: AsyncMock) -> None:
     """Test delete_job makes correct API call."""
@@ -164,33 +380,156 @@ async def test_delete_job_success(client: ComputeClient, mock_httpx_client: Asyn
     await client.delete_job("test-123")
 
     expected_endpoint = ComputeClientConfig.ENDPOINT_DELETE_JOB.format(job_id="test-123")
-    _ = cast(Any, mock_httpx_client.delete).assert_called_once_with(expected_endpoint, headers={})
+    _ = cast(Any, mock_httpx_client.delete).assert_called_once_with(expected_endpoint)
     _ = cast(Any, mock_response.raise_for_status).assert_called_once()
 
 
+def _mock_stream(
+    mock_httpx_client: AsyncMock,
+    chunks: list[bytes],
+    headers: dict[str, str] | None = None,
+    error: BaseException | None = None,
+) -> MagicMock:
+    """Configure mock_httpx_client.stream() to yield the given body chunks.
+
+    If error is given it is raised after the last chunk, as a dropped
+    connection would be.
+    """
+
+    async def aiter_bytes(chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        _ = chunk_size
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    mock_response = MagicMock()
+    mock_response.headers = httpx.Headers(headers or {})
+    mock_response.aiter_bytes = MagicMock(side_effect=aiter_bytes)
+
+    stream_ctx = MagicMock()
+    stream_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+    stream_ctx.__aexit__ = AsyncMock(return_value=None)
+    mock_httpx_client.stream = MagicMock(return_value=stream_ctx)
+    return mock_response
+
+
 @pytest.mark.asyncio
 async def test_download_job_file_success(
     client: ComputeClient, mock_httpx_client: AsyncMock, tmp_path: Path
 ) -> None:
-    """Test download_job_file downloads and saves file."""
-    file_content = b"test file content"
-    mock_response = MagicMock()
-    mock_response.content = file_content
-    mock_httpx_client.get.return_value = mock_response
+    """Test download_job_file streams and saves file."""
+    chunks = [b"test file ", b"content"]
+    mock_response = _mock_stream(mock_httpx_client, chunks)
 
     dest = tmp_path / "output.txt"
-    await client.download_job_file("test-123", "output/result.txt", dest)
+    written = await client.download_job_file("test-123", "output/result.txt", dest)
 
-    # Verify file was written
+    # Verify file was written and the byte count reported
     assert dest.exists()
-    assert dest.read_bytes() == file_content
+    assert dest.read_bytes() == b"".join(chunks)
+    assert written == len(b"".join(chunks))
 
-    # Verify correct endpoint was called
+    # Verify correct endpoint was streamed with the default chunk size
     expected_endpoint = ComputeClientConfig.ENDPOINT_GET_JOB_FILE.format(
         job_id="test-123", file_path="output/result.txt"
     )
-    _ = cast(Any, mock_httpx_client.get).assert_called_once_with(expected_endpoint, headers={})
+    _ = cast(Any, mock_httpx_client.stream).assert_called_once_with(
+        "GET", expected_endpoint
+    )
     _ = cast(Any, mock_response.raise_for_status).assert_called_once()
+    _ = cast(Any, mock_response.aiter_bytes).assert_called_once_with(
+        ComputeClientConfig.DOWNLOAD_CHUNK_SIZE
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_job_file_custom_chunk_size(
+    client: ComputeClient, mock_httpx_client: AsyncMock, tmp_path: Path
+) -> None:
+    """Test download_job_file honours an explicit chunk size."""
+    mock_response = _mock_stream(mock_httpx_client, [b"abc"])
+
+    dest = tmp_path / "output.bin"
+    written = await client.download_job_file(
+        "test-123", "output/result.bin", dest, chunk_size=1024
+    )
+
+    assert dest.read_bytes() == b"abc"
+    assert written == 3
+    _ = cast(Any, mock_response.aiter_bytes).assert_called_once_with(1024)
+
+
+@pytest.mark.asyncio
+async def test_download_job_file_max_bytes_aborts(
+    client: ComputeClient, mock_httpx_client: AsyncMock, tmp_path: Path
+) -> None:
+    """Test download_job_file stops at max_bytes and removes the partial file."""
+    _ = _mock_stream(mock_httpx_client, [b"12345", b"67890"])
+
+    dest = tmp_path / "output.bin"
+    with pytest.raises(ComputeClientError, match="max_bytes=8"):
+        _ = await client.download_job_file(
+            "test-123", "output/result.bin", dest, max_bytes=8
+        )
+
+    assert not dest.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_job_file_max_bytes_exact(
+    client: ComputeClient, mock_httpx_client: AsyncMock, tmp_path: Path
+) -> None:
+    """Test a body of exactly max_bytes is accepted."""
+    _ = _mock_stream(mock_httpx_client, [b"12345", b"67890"])
+
+    dest = tmp_path / "output.bin"
+    written = await client.download_job_file(
+        "test-123", "output/result.bin", dest, max_bytes=10
+    )
+
+    assert written == 10
+    assert dest.read_bytes() == b"1234567890"
+
+
+@pytest.mark.asyncio
+async def test_download_job_file_rejects_large_content_length(
+    client: ComputeClient, mock_httpx_client: AsyncMock, tmp_path: Path
+) -> None:
+    """Test an announced oversized body is refused before dest is touched."""
+    mock_response = _mock_stream(
+        mock_httpx_client, [b"12345", b"67890"], headers={"Content-Length": "10"}
+    )
+
+    dest = tmp_path / "output.bin"
+    _ = dest.write_bytes(b"keep me")
+    with pytest.raises(ComputeClientError, match="max_bytes=8"):
+        _ = await client.download_job_file(
+            "test-123", "output/result.bin", dest, max_bytes=8
+        )
+
+    assert dest.read_bytes() == b"keep me"
+    _ = cast(Any, mock_response.aiter_bytes).assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error", [httpx.ReadError("connection reset"), asyncio.CancelledError()]
+)
+async def test_download_job_file_removes_partial_file_on_failure(
+    client: ComputeClient,
+    mock_httpx_client: AsyncMock,
+    tmp_path: Path,
+    error: BaseException,
+) -> None:
+    """Test a download failing or cancelled mid-stream leaves no partial file."""
+    _ = _mock_stream(mock_httpx_client, [b"12345"], error=error)
+
+    dest = tmp_path / "output.bin"
+    with pytest.raises(type(error)):
+        _ = await client.download_job_file("test-123", "output/result.bin", dest)
+
+    assert not dest.exists()
 
 
 @pytest.mark.asyncio
@@ -199,7 +538,7 @@ async def test_get_capabilities_success(client: ComputeClient, mock_httpx_client
     caps_data = {"num_workers": 2, "capabilities": {"clip_embedding": 1, "exif": 1}}
 
     mock_response = MagicMock()
-    mock_response.json.return_value = caps_data
+    mock_response.content = json.dumps(caps_data).encode()
     mock_httpx_client.get.return_value = mock_response
 
     caps = await client.get_capabilities()
@@ -209,11 +548,32 @@ async def test_get_capabilities_success(client: ComputeClient, mock_httpx_client
 
     # Verify correct endpoint was called
     _ = cast(Any, mock_httpx_client.get).assert_called_once_with(
-        ComputeClientConfig.ENDPOINT_CAPABILITIES, headers={}
+        ComputeClientConfig.ENDPOINT_CAPABILITIES
     )
     _ = cast(Any, mock_response.raise_for_status).assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_capabilities_revalidates_with_etag(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test a 304 for a matching ETag returns the cached capabilities."""
+    request = httpx.Request("GET", ComputeClientConfig.ENDPOINT_CAPABILITIES)
+    caps_data = {"num_workers": 1, "capabilities": {"exif": 1}}
+    mock_httpx_client.get.side_effect = [
+        httpx.Response(200, json=caps_data, headers={"ETag": '"v1"'}, request=request),
+        httpx.Response(304, request=request),
+    ]
+
+    first = await client.get_capabilities()
+    second = await client.get_capabilities()
+
+    assert second is first
+    _ = cast(Any, mock_httpx_client.get).assert_called_with(
+        ComputeClientConfig.ENDPOINT_CAPABILITIES, headers={"If-None-Match": '"v1"'}
+    )
+
+
 @pytest.mark.asyncio
 async def test_wait_for_workers_success(
     client: ComputeClient, mock_mqtt_monitor: MagicMock
@@ -227,6 +587,45 @@ async def test_wait_for_workers_success(
     assert mock_mqtt_monitor.wait_for_capability.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_wait_for_workers_waits_concurrently(
+    client: ComputeClient, mock_mqtt_monitor: MagicMock
+) -> None:
+    """Test wait_for_workers waits on all capabilities at the same time."""
+
+    async def _slow_capability(task_type: str, timeout: float | None = None) -> bool:
+        await asyncio.sleep(0.2)
+        return True
+
+    mock_mqtt_monitor.wait_for_capability = AsyncMock(side_effect=_slow_capability)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await client.wait_for_workers(["clip_embedding", "exif", "hash"])
+
+    assert result is True
+    assert loop.time() - start < 0.5
+    assert mock_mqtt_monitor.wait_for_capability.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_workers_rechecks_live_state(
+    client: ComputeClient, mock_mqtt_monitor: MagicMock
+) -> None:
+    """Test every call consults the live MQTT worker state, so a lost worker is seen."""
+    mock_mqtt_monitor.wait_for_capability = AsyncMock(
+        side_effect=[True, WorkerUnavailableError("clip_embedding", {})]
+    )
+
+    assert await client.wait_for_workers(["clip_embedding", "clip_embedding"]) is True
+
+    # The only clip_embedding worker disconnected since the previous call
+    with pytest.raises(WorkerUnavailableError):
+        _ = await client.wait_for_workers(["clip_embedding"])
+
+    assert mock_mqtt_monitor.wait_for_capability.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_wait_for_workers_no_requirements(
     client: ComputeClient, mock_mqtt_monitor: MagicMock
@@ -274,6 +673,23 @@ def test_subscribe_job_updates(client: ComputeClient, mock_mqtt_monitor: MagicMo
     )
 
 
+def test_subscribe_job_updates_batch(
+    client: ComputeClient, mock_mqtt_monitor: MagicMock
+) -> None:
+    """Test mqtt_subscribe_job_updates_batch delegates to MQTT monitor."""
+    mock_mqtt_monitor.subscribe_job_updates_batch.return_value = ["sub-1", "sub-2"]
+
+    sub_ids = client.mqtt_subscribe_job_updates_batch(["job-1", "job-2"])
+
+    assert sub_ids == ["sub-1", "sub-2"]
+    _ = cast(Any, mock_mqtt_monitor.subscribe_job_updates_batch).assert_called_once_with(
+        job_ids=["job-1", "job-2"],
+        on_progress=None,
+        on_complete=None,
+        task_type="unknown",
+    )
+
+
 def test_unsubscribe(client: ComputeClient, mock_mqtt_monitor: MagicMock) -> None:
     """Test unsubscribe delegates to MQTT monitor."""
     _ = client.unsubscribe("sub-123")
@@ -304,10 +720,10 @@ async def test_wait_for_job_success(client: ComputeClient, mock_httpx_client: As
     }
 
     mock_response_1 = MagicMock()
-    mock_response_1.json.return_value = job_in_progress
+    mock_response_1.content = json.dumps(job_in_progress).encode()
 
     mock_response_2 = MagicMock()
-    mock_response_2.json.return_value = job_completed
+    mock_response_2.content = json.dumps(job_completed).encode()
 
     mock_httpx_client.get.side_effect = [mock_response_1, mock_response_2]
 
@@ -318,7 +734,81 @@ async def test_wait_for_job_success(client: ComputeClient, mock_httpx_client: As
 
 
 @pytest.mark.asyncio
-async def test_wait_for_job_timeout(client: ComputeClient, mock_httpx_client: AsyncMock) -> None:
+async def test_wait_for_job_wakes_on_mqtt_completion(
+    client: ComputeClient, mock_httpx_client: AsyncMock, mock_mqtt_monitor: MagicMock
+) -> None:
+    """Test wait_for_job re-polls as soon as MQTT reports completion."""
+    job_data = {
+        "job_id": "test-123",
+        "task_type": "test",
+        "status": "processing",
+        "progress": 50,
+        "created_at": 1234567890,
+        "params": {},
+    }
+    mock_response_1 = MagicMock()
+    mock_response_1.content = json.dumps(job_data).encode()
+    mock_response_2 = MagicMock()
+    mock_response_2.content = json.dumps({**job_data, "status": "completed"}).encode()
+    mock_httpx_client.get.side_effect = [mock_response_1, mock_response_2]
+
+    completed_job = JobResponse.model_validate_json(mock_response_2.content)
+
+    def _subscribe(job_id: str, on_complete: Any) -> str:
+        # Deliver the completion event from another thread, as paho does
+        threading.Timer(0.05, on_complete, args=(completed_job,)).start()
+        return "sub-1"
+
+    mock_mqtt_monitor.subscribe_job_updates.side_effect = _subscribe
+
+    # Poll interval far exceeds the timeout, so only the MQTT wake-up can finish in time
+    with patch.object(client, "get_job", wraps=client.get_job) as get_job_spy:
+        job = await asyncio.wait_for(client.wait_for_job("test-123", poll_interval=30.0), 2.0)
+
+    assert job.status == "completed"
+    assert mock_httpx_client.get.call_count == 2
+    # The re-poll after the wake-up must not join a request sent before it
+    assert [call.kwargs["fresh"] for call in get_job_spy.call_args_list] == [False, True]
+    # The monitor auto-unsubscribes after on_complete, so the client must not
+    mock_mqtt_monitor.unsubscribe.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_job_backs_off_when_http_lags_mqtt(
+    client: ComputeClient, mock_httpx_client: AsyncMock, mock_mqtt_monitor: MagicMock
+) -> None:
+    """Test a stale HTTP status after MQTT completion does not cause a busy poll."""
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(
+        {
+            "job_id": "test-123",
+            "task_type": "test",
+            "status": "processing",
+            "created_at": 1234567890,
+        }
+    ).encode()
+    mock_httpx_client.get.return_value = mock_response
+
+    def _subscribe(job_id: str, on_complete: Any) -> str:
+        completed_job = JobResponse(
+            job_id=job_id, task_type="test", status="completed", created_at=1234567890
+        )
+        threading.Timer(0.01, on_complete, args=(completed_job,)).start()
+        return "sub-1"
+
+    mock_mqtt_monitor.subscribe_job_updates.side_effect = _subscribe
+
+    with pytest.raises(TimeoutError):
+        _ = await client.wait_for_job("test-123", poll_interval=0.1, timeout=0.3)
+
+    # One early re-poll after the wake-up, then the regular backoff schedule
+    assert mock_httpx_client.get.call_count <= 5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_job_timeout(
+    client: ComputeClient, mock_httpx_client: AsyncMock, mock_mqtt_monitor: MagicMock
+) -> None:
     """Test wait_for_job raises TimeoutError."""
     # Always return in_progress
     job_data = {
@@ -331,7 +821,7 @@ async def test_wait_for_job_timeout(client: ComputeClient, mock_httpx_client: As
     }
 
     mock_response = MagicMock()
-    mock_response.json.return_value = job_data
+    mock_response.content = json.dumps(job_data).encode()
     mock_httpx_client.get.return_value = mock_response
 
     with pytest.raises(TimeoutError) as exc_info:
@@ -339,6 +829,51 @@ async def test_wait_for_job_timeout(client: ComputeClient, mock_httpx_client: As
 
     assert "test-123" in str(exc_info.value)
     assert "timeout" in str(exc_info.value).lower()
+    # The MQTT completion listener is released when polling gives up
+    mock_mqtt_monitor.unsubscribe.assert_called_once_with(
+        mock_mqtt_monitor.subscribe_job_updates.return_value
+    )
+
+
+@pytest.mark.asyncio
+async def test_wait_for_job_timeout_does_not_overshoot(
+    client: ComputeClient, mock_httpx_client: AsyncMock
+) -> None:
+    """Test the last backoff wait is clipped to the remaining timeout budget."""
+    job_data = {
+        "job_id": "test-123",
+        "task_type": "test",
+        "status": "processing",
+        "progress": 50,
+        "created_at": 1234567890,
+        "params": {},
+    }
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(job_data).encode()
+    mock_httpx_client.get.return_value = mock_response
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(TimeoutError):
+        await client.wait_for_job("test-123", poll_interval=5.0, timeout=0.2)
+
+    assert loop.time() - start < 1.0
+    # One poll up front and one final poll at the deadline
+    assert mock_httpx_client.get.call_count == 2
+
+
+def test_plugin_accessor_is_cached(client: ComputeClient) -> None:
+    """Test plugin accessors build one client and store it on the instance."""
+    from cl_client.plugins.clip_embedding import ClipEmbeddingClient
+
+    plugin = client.clip_embedding
+
+    assert isinstance(plugin, ClipEmbeddingClient)
+    assert client.clip_embedding is plugin
+    assert vars(client)["clip_embedding"] is plugin
+    # Plugins route requests through this client and never open their own pool
+    assert plugin.client is client
+    assert not hasattr(plugin, "_session")
 
 
 @pytest.mark.asyncio
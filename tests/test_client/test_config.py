@@ -28,6 +28,37 @@ def test_core_endpoints():
     assert ComputeClientConfig.ENDPOINT_CAPABILITIES == "/capabilities"
 
 
+def test_job_endpoint_helpers_match_templates():
+    """Test job endpoint helpers build the same paths as the templates."""
+    assert ComputeClientConfig.get_job_endpoint("abc") == (
+        ComputeClientConfig.ENDPOINT_GET_JOB.format(job_id="abc")
+    )
+    assert ComputeClientConfig.get_job_file_endpoint("abc", "out/x.png") == (
+        ComputeClientConfig.ENDPOINT_GET_JOB_FILE.format(job_id="abc", file_path="out/x.png")
+    )
+
+
+def test_job_endpoint_helpers_follow_templates(monkeypatch: pytest.MonkeyPatch):
+    """Test the helpers follow runtime changes to their own templates."""
+    monkeypatch.setattr(ComputeClientConfig, "ENDPOINT_GET_JOB", "/v2/jobs/{job_id}/status")
+    monkeypatch.setattr(
+        ComputeClientConfig, "ENDPOINT_GET_JOB_FILE", "/v2/jobs/{job_id}/out/{file_path}"
+    )
+
+    assert ComputeClientConfig.get_job_endpoint("abc") == "/v2/jobs/abc/status"
+    assert ComputeClientConfig.get_job_file_endpoint("abc", "x") == "/v2/jobs/abc/out/x"
+
+
+def test_job_endpoint_helper_rejects_template_without_placeholder(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test a template missing its placeholder fails loudly instead of dropping the ID."""
+    monkeypatch.setattr(ComputeClientConfig, "ENDPOINT_GET_JOB", "/jobs/current")
+
+    with pytest.raises(ValueError, match="job_id"):
+        _ = ComputeClientConfig.get_job_endpoint("abc")
+
+
 def test_plugin_endpoints():
     """Test all plugin endpoints are defined."""
     plugins = ComputeClientConfig.PLUGIN_ENDPOINTS
@@ -75,9 +106,86 @@ def test_job_monitoring_config():
     assert ComputeClientConfig.DEFAULT_POLL_INTERVAL == 1.0
     assert ComputeClientConfig.MAX_POLL_BACKOFF == 10.0
     assert ComputeClientConfig.POLL_BACKOFF_MULTIPLIER == 1.5
+    assert ComputeClientConfig.TERMINAL_JOB_STATUSES == frozenset({"completed", "failed"})
 
 
 def test_worker_validation_config():
     """Test worker validation configuration."""
     assert ComputeClientConfig.WORKER_WAIT_TIMEOUT == 30.0
     assert ComputeClientConfig.WORKER_CAPABILITY_CHECK_INTERVAL == 1.0
+
+
+def test_http_limits_env_overrides(monkeypatch: pytest.MonkeyPatch):
+    """Test pool limits come from the class defaults unless overridden by env."""
+    limits = ComputeClientConfig.http_limits()
+    assert limits.max_connections == ComputeClientConfig.HTTP_MAX_CONNECTIONS
+    assert limits.max_keepalive_connections == ComputeClientConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS
+    assert limits.keepalive_expiry == ComputeClientConfig.HTTP_KEEPALIVE_EXPIRY
+
+    monkeypatch.setenv("CL_HTTPX_MAX_CONN", "200")
+    monkeypatch.setenv("CL_HTTPX_MAX_KEEPALIVE", "100")
+    monkeypatch.setenv("CL_HTTPX_KEEPALIVE_EXPIRY", "45")
+    limits = ComputeClientConfig.http_limits()
+    assert limits.max_connections == 200
+    assert limits.max_keepalive_connections == 100
+    assert limits.keepalive_expiry == 45.0
+
+
+def test_http_limits_defaults_not_below_httpx():
+    """Test the default pool is at least as large as httpx.AsyncClient's default."""
+    limits = ComputeClientConfig.http_limits()
+    # httpx.AsyncClient() defaults to 100 connections / 20 keep-alive
+    assert limits.max_connections is not None and limits.max_connections >= 100
+    assert (
+        limits.max_keepalive_connections is not None
+        and limits.max_keepalive_connections >= 20
+    )
+
+
+@pytest.mark.parametrize("raw", ["abc", "", "0", "-5", "inf", "nan"])
+def test_http_limits_ignores_invalid_env(monkeypatch: pytest.MonkeyPatch, raw: str):
+    """Test malformed pool env values fall back to the defaults instead of raising."""
+    monkeypatch.setenv("CL_HTTPX_MAX_CONN", raw)
+    monkeypatch.setenv("CL_HTTPX_KEEPALIVE_EXPIRY", raw)
+
+    limits = ComputeClientConfig.http_limits()
+    assert limits.max_connections == ComputeClientConfig.HTTP_MAX_CONNECTIONS
+    assert limits.keepalive_expiry == ComputeClientConfig.HTTP_KEEPALIVE_EXPIRY
+
+
+@pytest.mark.parametrize("raw", ["0.5", "1.5"])
+def test_http_limits_rejects_fractional_counts(monkeypatch: pytest.MonkeyPatch, raw: str):
+    """Test fractional connection counts are ignored rather than truncated."""
+    monkeypatch.setenv("CL_HTTPX_MAX_CONN", raw)
+    monkeypatch.setenv("CL_HTTPX_MAX_KEEPALIVE", raw)
+    monkeypatch.setenv("CL_HTTPX_KEEPALIVE_EXPIRY", raw)
+
+    limits = ComputeClientConfig.http_limits()
+    assert limits.max_connections == ComputeClientConfig.HTTP_MAX_CONNECTIONS
+    assert limits.max_keepalive_connections == ComputeClientConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS
+    # The expiry is a duration, so fractional seconds stay valid
+    assert limits.keepalive_expiry == float(raw)
+
+
+def test_http_timeout_caps_connect():
+    """Test the connect timeout never exceeds the overall request timeout."""
+    timeout = ComputeClientConfig.http_timeout(30.0)
+    assert timeout.read == 30.0
+    assert timeout.connect == ComputeClientConfig.HTTP_CONNECT_TIMEOUT
+
+    assert ComputeClientConfig.http_timeout(2.0).connect == 2.0
+
+
+def test_http2_enabled_follows_h2_and_env(monkeypatch: pytest.MonkeyPatch):
+    """Test HTTP/2 is enabled only when h2 is importable and not disabled by env."""
+    import importlib.util
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+    assert ComputeClientConfig.http2_enabled() is True
+
+    monkeypatch.setenv("CL_HTTPX_HTTP2", "0")
+    assert ComputeClientConfig.http2_enabled() is False
+
+    monkeypatch.delenv("CL_HTTPX_HTTP2")
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert ComputeClientConfig.http2_enabled() is False
@@ -0,0 +1,76 @@
+"""Tests for the package's lazy top-level exports."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cl_client
+
+
+def _run_python(code: str, **env: str) -> str:
+    """Run code in a fresh interpreter that sees the same cl_client."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), **env},
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy attribute resolution."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ is reachable from the package."""
+        for name in cl_client.__all__:
+            assert getattr(cl_client, name) is not None
+
+    def test_lazy_table_only_names_public_exports(self):
+        """Every lazily resolved name is declared in the immutable __all__."""
+        assert isinstance(cl_client.__all__, tuple)
+        assert set(cl_client._LAZY) <= set(cl_client.__all__)
+
+    def test_lazy_export_matches_submodule(self):
+        """A lazily resolved name is the submodule's object and is cached."""
+        from cl_client.store_manager import StoreManager
+
+        assert cl_client.StoreManager is StoreManager
+        assert vars(cl_client)["StoreManager"] is StoreManager
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = cl_client.DoesNotExist  # type: ignore[attr-defined]
+
+    def test_dir_lists_lazy_exports(self):
+        """dir() includes names that have not been resolved yet."""
+        assert set(cl_client.__all__) <= set(dir(cl_client))
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Importing the package alone leaves httpx, pydantic and paho unloaded."""
+        out = _run_python(
+            "import sys, cl_client; "
+            "print(sorted(m for m in ('httpx', 'pydantic', 'paho.mqtt.client') "
+            "if m in sys.modules))"
+        )
+        assert out == "[]"
+
+    def test_import_defers_jwt_decoding_modules(self):
+        """base64/json/datetime are only loaded once a JWT is actually parsed."""
+        out = _run_python(
+            "import sys, cl_client; "
+            "print(sorted(m for m in ('base64', 'json', 'datetime') if m in sys.modules))"
+        )
+        assert out == "[]"
+
+    def test_eager_import_env_resolves_everything(self):
+        """CL_CLIENT_EAGER_IMPORT=1 imports all lazy exports at import time."""
+        out = _run_python(
+            "import sys, cl_client; print('cl_client.compute_client' in sys.modules)",
+            CL_CLIENT_EAGER_IMPORT="1",
+        )
+        assert out == "True"
@@ -1,6 +1,9 @@
 """Tests for mqtt_monitor.py"""
 
+import asyncio
+import inspect
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -186,6 +189,130 @@ def test_two_callback_system(monitor, mock_mqtt_client):
     assert len(complete_calls) == 1  # Only called for completion
 
 
+@pytest.mark.asyncio
+async def test_async_callbacks_scheduled_on_event_loop(monitor, mock_mqtt_client):
+    """Test async callbacks are normalized at subscribe time and run on the loop."""
+    done = asyncio.Event()
+    statuses: list[str] = []
+
+    async def on_complete(job: JobResponse):
+        statuses.append(job.status)
+        done.set()
+
+    sub_id = monitor.subscribe_job_updates(job_id="job-a", on_complete=on_complete)
+
+    # Stored callback is already a plain call, no per-message coroutine check
+    stored_on_complete = monitor._job_subscriptions[sub_id][2]
+    assert stored_on_complete is not None
+    assert not inspect.iscoroutinefunction(stored_on_complete)
+
+    mock_msg = MagicMock()
+    mock_msg.topic = ComputeClientConfig.MQTT_JOB_EVENTS_TOPIC
+    mock_msg.payload = json.dumps(
+        {"job_id": "job-a", "event_type": "completed", "progress": 100, "timestamp": 1}
+    ).encode()
+
+    # Deliver from another thread, as paho's network loop does
+    await asyncio.to_thread(monitor._handle_job_event, mock_msg)
+    await asyncio.wait_for(done.wait(), 1.0)
+
+    assert statuses == ["completed"]
+
+
+def test_job_events_dispatch_only_to_matching_job(monitor, mock_mqtt_client):
+    """Test events reach only subscribers of that job and completed jobs are unindexed."""
+    calls: list[str] = []
+
+    sub_a = monitor.subscribe_job_updates(
+        job_id="job-a", on_progress=lambda job: calls.append(f"a:{job.status}")
+    )
+    _ = monitor.subscribe_job_updates(
+        job_id="job-b", on_progress=lambda job: calls.append(f"b:{job.status}")
+    )
+
+    mock_msg = MagicMock()
+    mock_msg.topic = ComputeClientConfig.MQTT_JOB_EVENTS_TOPIC
+    mock_msg.payload = json.dumps(
+        {"job_id": "job-a", "event_type": "completed", "progress": 100, "timestamp": 1}
+    ).encode()
+
+    monitor._handle_job_event(mock_msg)
+    assert calls == ["a:completed"]
+
+    # Unsubscribing drops the job from the dispatch index
+    monitor.unsubscribe(sub_a)
+    assert "job-a" not in monitor._job_index
+    assert "job-b" in monitor._job_index
+
+    monitor._handle_job_event(mock_msg)
+    assert calls == ["a:completed"]
+
+
+def test_subscribe_job_updates_batch(monitor, mock_mqtt_client):
+    """Test batch subscribe registers every job locally, in order, without SUBSCRIBE."""
+    calls: list[str] = []
+    mock_mqtt_client.subscribe.reset_mock()
+
+    sub_ids = monitor.subscribe_job_updates_batch(
+        ["job-a", "job-b"], on_progress=lambda job: calls.append(job.job_id)
+    )
+
+    assert len(set(sub_ids)) == 2
+    assert [monitor._job_subscriptions[s][0] for s in sub_ids] == ["job-a", "job-b"]
+    assert monitor._job_index["job-b"] == {sub_ids[1]}
+    mock_mqtt_client.subscribe.assert_not_called()
+
+    mock_msg = MagicMock()
+    mock_msg.topic = ComputeClientConfig.MQTT_JOB_EVENTS_TOPIC
+    mock_msg.payload = json.dumps(
+        {"job_id": "job-b", "event_type": "processing", "progress": 50, "timestamp": 1}
+    ).encode()
+
+    monitor._handle_job_event(mock_msg)
+    assert calls == ["job-b"]
+
+
+def test_subscribe_during_unsubscribe_stays_indexed(monitor, mock_mqtt_client):
+    """Test a subscription added while the job's last one is removed stays indexed."""
+    added: list[str] = []
+    threads: list[threading.Thread] = []
+
+    class _RacingIndex(dict[str, set[str]]):
+        def __delitem__(self, job_id: str) -> None:
+            # Another thread subscribes to the same job mid-removal
+            if not threads:
+                thread = threading.Thread(
+                    target=lambda: added.append(monitor.subscribe_job_updates(job_id=job_id))
+                )
+                threads.append(thread)
+                thread.start()
+                thread.join(timeout=0.2)
+            super().__delitem__(job_id)
+
+    monitor._job_index = _RacingIndex()
+    sub_id = monitor.subscribe_job_updates(job_id="job-a")
+    monitor.unsubscribe(sub_id)
+    threads[0].join()
+
+    assert monitor._job_index.get("job-a") == {added[0]}
+
+
+def test_job_index_cleared_after_auto_unsubscribe(monitor, mock_mqtt_client):
+    """Test on_complete auto-unsubscribe also removes the job from the dispatch index."""
+    sub_id = monitor.subscribe_job_updates(job_id="job-a", on_complete=lambda job: None)
+
+    mock_msg = MagicMock()
+    mock_msg.topic = ComputeClientConfig.MQTT_JOB_EVENTS_TOPIC
+    mock_msg.payload = json.dumps(
+        {"job_id": "job-a", "event_type": "failed", "progress": 0, "timestamp": 1}
+    ).encode()
+
+    monitor._handle_job_event(mock_msg)
+
+    assert sub_id not in monitor._job_subscriptions
+    assert "job-a" not in monitor._job_index
+
+
 def test_worker_capability_tracking(monitor, mock_mqtt_client):
     """Test worker capability message handling."""
     worker_id = "worker-123"
@@ -1,5 +1,6 @@
 """Unit tests for StoreClient."""
 
+import json
 from unittest.mock import AsyncMock, Mock
 
 import httpx
@@ -64,7 +65,7 @@ class TestStoreClientReadOperations:
         """Test listing entities."""
         # Mock response
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "items": [
                 {"id": 1, "label": "Entity 1"},
                 {"id": 2, "label": "Entity 2"},
@@ -77,7 +78,7 @@ class TestStoreClientReadOperations:
                 "has_next": False,
                 "has_prev": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -99,7 +100,7 @@ class TestStoreClientReadOperations:
     async def test_list_entities_with_search(self, store_client, mock_httpx_client):
         """Test listing entities with search query."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "items": [],
             "pagination": {
                 "page": 1,
@@ -109,7 +110,7 @@ class TestStoreClientReadOperations:
                 "has_next": False,
                 "has_prev": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -122,7 +123,7 @@ class TestStoreClientReadOperations:
     async def test_list_entities_with_parent_id(self, store_client, mock_httpx_client):
         """Test listing entities with parent_id filter."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "items": [],
             "pagination": {
                 "page": 1,
@@ -132,7 +133,7 @@ class TestStoreClientReadOperations:
                 "has_next": False,
                 "has_prev": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -145,7 +146,7 @@ class TestStoreClientReadOperations:
     async def test_list_entities_with_parent_id_zero(self, store_client, mock_httpx_client):
         """Test listing root-level entities with parent_id=0."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "items": [],
             "pagination": {
                 "page": 1,
@@ -155,7 +156,7 @@ class TestStoreClientReadOperations:
                 "has_next": False,
                 "has_prev": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -168,7 +169,7 @@ class TestStoreClientReadOperations:
     async def test_list_entities_with_is_collection(self, store_client, mock_httpx_client):
         """Test listing entities with is_collection filter."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "items": [],
             "pagination": {
                 "page": 1,
@@ -178,7 +179,7 @@ class TestStoreClientReadOperations:
                 "has_next": False,
                 "has_prev": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -192,11 +193,11 @@ class TestStoreClientReadOperations:
         """Test looking up an entity by MD5."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 42,
             "label": "Found Entity",
             "md5": "abc123",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -225,11 +226,11 @@ class TestStoreClientReadOperations:
     async def test_read_entity(self, store_client, mock_httpx_client):
         """Test reading entity by ID."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 123,
             "label": "Test Entity",
             "description": "Test description",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -247,10 +248,10 @@ class TestStoreClientReadOperations:
     async def test_read_entity_with_version(self, store_client, mock_httpx_client):
         """Test reading specific version of entity."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 123,
             "label": "Old Label",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -263,10 +264,10 @@ class TestStoreClientReadOperations:
     async def test_get_versions(self, store_client, mock_httpx_client):
         """Test getting version history."""
         mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {"version": 1, "transaction_id": 100, "label": "V1"},
             {"version": 2, "transaction_id": 101, "label": "V2"},
-        ]
+        ]).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -285,11 +286,11 @@ class TestStoreClientWriteOperations:
     async def test_create_entity_collection(self, store_client, mock_httpx_client):
         """Test creating a collection entity."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 1,
             "label": "New Collection",
             "is_collection": True,
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.post.return_value = mock_response
 
@@ -317,11 +318,11 @@ class TestStoreClientWriteOperations:
         test_file.write_bytes(b"fake image data")
 
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 2,
             "label": "Photo",
             "file_path": "/media/test.jpg",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.post.return_value = mock_response
 
@@ -342,10 +343,10 @@ class TestStoreClientWriteOperations:
     async def test_update_entity(self, store_client, mock_httpx_client):
         """Test full update of entity."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 123,
             "label": "Updated Label",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.put.return_value = mock_response
 
@@ -366,10 +367,10 @@ class TestStoreClientWriteOperations:
     async def test_patch_entity(self, store_client, mock_httpx_client):
         """Test partial update of entity."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 123,
             "label": "Patched Label",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.patch.return_value = mock_response
 
@@ -390,10 +391,10 @@ class TestStoreClientWriteOperations:
     async def test_patch_entity_with_unset(self, store_client, mock_httpx_client):
         """Test patch entity with UNSET sentinel."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 123,
             "label": "Original Label",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.patch.return_value = mock_response
 
@@ -417,10 +418,10 @@ class TestStoreClientWriteOperations:
     async def test_patch_entity_soft_delete(self, store_client, mock_httpx_client):
         """Test soft delete via patch."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 123,
             "is_deleted": True,
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.patch.return_value = mock_response
 
@@ -455,11 +456,11 @@ class TestStoreClientAdminOperations:
     async def test_get_pref(self, store_client, mock_httpx_client):
         """Test getting store preferences."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "guest_mode": False,
             "updated_at": 1704067200000,
             "updated_by": "admin",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -477,11 +478,11 @@ class TestStoreClientAdminOperations:
 
         # Mock GET response for get_pref() call after PUT
         mock_get_response = Mock()
-        mock_get_response.json.return_value = {
+        mock_get_response.content = json.dumps({
             "guest_mode": True,
             "updated_at": 1704067200000,
             "updated_by": "admin",
-        }
+        }).encode()
         mock_get_response.raise_for_status = Mock()
 
         mock_httpx_client.put.return_value = mock_put_response
@@ -539,7 +540,7 @@ class TestStoreClientAuthIntegration:
         client._client = mock_httpx_client
 
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "items": [],
             "pagination": {
                 "page": 1,
@@ -549,7 +550,7 @@ class TestStoreClientAuthIntegration:
                 "has_next": False,
                 "has_prev": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.get.return_value = mock_response
 
@@ -598,12 +599,12 @@ class TestStoreClientIntelligenceOperations:
     async def test_update_known_person_name(self, store_client, mock_httpx_client):
         """Test updating known person name."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": 1,
             "name": "New Name",
             "created_at": 1000,
             "updated_at": 2000
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_httpx_client.patch.return_value = mock_response
 
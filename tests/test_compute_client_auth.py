@@ -1,5 +1,6 @@
 """Tests for dynamic header updates in ComputeClient."""
 
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from cl_client.compute_client import ComputeClient
@@ -16,11 +17,26 @@ async def test_dynamic_header_updates():
 
     # Setup get_headers to return different values on subsequent calls
     mock_auth.get_headers.side_effect = [
-        {"Authorization": "Bearer token1"},  # Init call
-        {"Authorization": "Bearer token2"},  # First request
-        {"Authorization": "Bearer token3"},  # Second request
+        {"Authorization": "Bearer token1"},  # First request
+        {"Authorization": "Bearer token2"},  # Second request
     ]
 
+    # Record the Authorization header each request actually carries
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Authorization"))
+        return httpx.Response(
+            200,
+            json={
+                "job_id": "job1",
+                "status": "completed",
+                "task_type": "test",
+                "created_at": 1234567890,
+                "updated_at": 1234567890
+            },
+        )
+
     # Mock MQTT monitor to prevent real connection
     with patch("cl_client.compute_client.get_mqtt_monitor") as mock_mqtt:
         mock_mqtt.return_value = Mock()
@@ -36,42 +52,29 @@ async def test_dynamic_header_updates():
             )
         )
 
-        # Verify init called get_headers once
-        assert mock_auth.get_headers.call_count == 1
+    # Headers are applied per request by the auth flow, not at construction
+    assert mock_auth.get_headers.call_count == 0
 
-        # Mock httpx session
-        with patch.object(client._session, 'get', new_callable=AsyncMock) as mock_get:
-            # Mock successful response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "job_id": "job1",
-                "status": "completed",
-                "task_type": "test",
-                "created_at": 1234567890,
-                "updated_at": 1234567890
-            }
-            mock_get.return_value = mock_response
-
-            # Make first request
-            await client.get_job("job1")
+    # Keep the client's auth flow but route requests to an in-memory handler
+    await client._session.aclose()
+    client._session = httpx.AsyncClient(
+        base_url=client.base_url,
+        auth=client._session.auth,
+        transport=httpx.MockTransport(handler),
+    )
 
-            # Verify first request used token2
-            mock_get.assert_called_with(
-                "/jobs/job1",
-                headers={"Authorization": "Bearer token2"}
-            )
+    # Make first request
+    await client.get_job("job1")
 
-            # Verify refresh was checked
-            mock_auth.refresh_token_if_needed.assert_called()
+    # Verify first request used token1 and refresh was checked
+    assert seen == ["Bearer token1"]
+    assert mock_auth.refresh_token_if_needed.await_count == 1
 
-            # Make second request
-            await client.get_job("job1")
+    # Make second request
+    await client.get_job("job1")
 
-            # Verify second request used token3
-            mock_get.assert_called_with(
-                "/jobs/job1",
-                headers={"Authorization": "Bearer token3"}
-            )
+    # Verify second request used token2
+    assert seen == ["Bearer token1", "Bearer token2"]
+    assert mock_auth.refresh_token_if_needed.await_count == 2
 
-        await client.close()
+    await client.close()
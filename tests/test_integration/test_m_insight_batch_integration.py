@@ -1,12 +1,16 @@
 """Batch integration test for MInsight intelligence tracking."""
 
 import asyncio
+import os
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path as PathlibPath
 
 import pytest
+from cl_client.mqtt_monitor import EntityStatusPayload
 from tests.test_utils import create_unique_copy
 
 sys.path.insert(0, str(PathlibPath(__file__).parent.parent))
@@ -40,58 +44,108 @@ async def test_m_insight_batch_upload_and_queue(
     status = status_result.data
     assert status and status.get("status") in ["running", "idle"], f"MInsight worker not online. Status: {status}"
     
-    # 2. Upload 30 unique images in parallel
+    # 2. Upload 30 unique images concurrently (bounded)
     NUM_IMAGES = 30
     print(f"\nUploading {NUM_IMAGES} unique images...")
+
+    # Phase boundaries (ns) so prep, upload and pickup latency are reported separately
+    phase_ns = {"start": time.perf_counter_ns()}
     
-    tasks = []
-    entity_ids = []
+    # Prepare unique copies concurrently; PIL releases the GIL while decoding and
+    # encoding, so threads overlap the per-image work without forking the test run
+    unique_paths = [
+        tmp_path / f"batch_{i}_{uuid.uuid4().hex[:6]}.jpg" for i in range(NUM_IMAGES)
+    ]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        _ = list(
+            executor.map(
+                create_unique_copy, repeat(test_image), unique_paths, range(NUM_IMAGES)
+            )
+        )
+    phase_ns["prepared"] = time.perf_counter_ns()
     
-    for i in range(NUM_IMAGES):
-        unique_path = tmp_path / f"batch_{i}_{uuid.uuid4().hex[:6]}.jpg"
-        create_unique_copy(test_image, unique_path, offset=i)
-        
-        # We wrap in a coroutine to capture the resulting ID
-        async def upload_task(path, idx):
+    # Status transitions are pushed over MQTT. Each entity is subscribed as soon
+    # as its own upload returns, so early uploads are tracked while later ones
+    # are still in flight; a single read per entity afterwards catches images
+    # MInsight picked up before their subscription was in place.
+    # We use a per-image timeout budget of 5s, min 60s total
+    TIMEOUT = max(60, NUM_IMAGES * 5)
+    PICKED_UP = ("queued", "processing", "completed")
+    pending_ids: set[int] = set()
+    all_picked_up = asyncio.Event()
+    uploads_done = False
+    sub_ids: list[str] = []
+    loop = asyncio.get_running_loop()
+
+    def mark_picked_up(entity_id: int) -> None:
+        pending_ids.discard(entity_id)
+        if uploads_done and not pending_ids:
+            all_picked_up.set()
+
+    def on_status(payload: EntityStatusPayload) -> None:
+        # Runs on the MQTT network thread; hand off to the event loop
+        if payload.status in PICKED_UP:
+            _ = loop.call_soon_threadsafe(mark_picked_up, payload.entity_id)
+
+    # Cap in-flight uploads so the batch queues on the client instead of
+    # oversubscribing the connection pool and the store's writer
+    MAX_INFLIGHT = 5
+    upload_slots = asyncio.Semaphore(MAX_INFLIGHT)
+
+    async def upload_task(path, idx):
+        async with upload_slots:
             res = await store_manager.create_entity(
                 label=f"Batch_Test_{idx}",
                 is_collection=False,
                 image_path=path
             )
-            return res
-            
-        tasks.append(upload_task(unique_path, i))
-    
-    results = await asyncio.gather(*tasks)
-    
-    for r in results:
-        assert r.is_success, f"Upload failed: {r.error}"
-        entity_ids.append(r.data.id)
-        
-    print(f"Successfully uploaded {len(entity_ids)} images.")
-    
-    # 3. Poll for intelligence_status == "queued"
-    # We use a per-image timeout budget of 5s, min 60s total
-    TIMEOUT = max(60, NUM_IMAGES * 5)
-    start_time = time.time()
-    pending_ids = set(entity_ids)
-    
-    print(f"Waiting for MInsight to queue images (timeout: {TIMEOUT}s)...")
-    
-    while pending_ids and (time.time() - start_time < TIMEOUT):
-        # Check intelligence status for each pending entity
-        for entity_id in list(pending_ids):
-            intel_result = await store_manager.get_entity_intelligence(entity_id)
+        if res.is_success:
+            pending_ids.add(res.data.id)
+            sub_ids.append(store_manager.monitor_entity(res.data.id, on_status))
+        return res
+
+    try:
+        results = await asyncio.gather(
+            *[upload_task(path, i) for i, path in enumerate(unique_paths)]
+        )
+        phase_ns["uploaded"] = time.perf_counter_ns()
+
+        failures = [r.error for r in results if not r.is_success]
+        assert not failures, f"Upload failed: {failures}"
+        entity_ids = [r.data.id for r in results]
+
+        print(f"Successfully uploaded {len(entity_ids)} images.")
 
-            if intel_result.is_success and intel_result.data:
-                # We accept any state that indicates MInsight has at least acknowledged/picked up the image
-                status = intel_result.data.overall_status
-                if status in ["queued", "processing", "completed"]:
-                    pending_ids.remove(entity_id)
+        # 3. Wait for intelligence_status to reach "queued" (or later)
+        print(f"Waiting for MInsight to queue images (timeout: {TIMEOUT}s)...")
+        uploads_done = True
+
+        for entity_id in entity_ids:
+            if entity_id not in pending_ids:
+                continue  # Already reported over MQTT
+            intel_result = await store_manager.get_entity_intelligence(entity_id)
+            # We accept any state that indicates MInsight has at least acknowledged/picked up the image
+            if (
+                intel_result.is_success
+                and intel_result.data
+                and intel_result.data.overall_status in PICKED_UP
+            ):
+                mark_picked_up(entity_id)
 
         if pending_ids:
             print(f"  {len(pending_ids)} images still not picked up by MInsight...")
-            await asyncio.sleep(2)
+            try:
+                await asyncio.wait_for(all_picked_up.wait(), timeout=TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for sub_id in sub_ids:
+            store_manager.stop_monitoring(sub_id)
+    phase_ns["picked_up"] = time.perf_counter_ns()
+
+    phases = list(phase_ns.items())
+    for (_, begin), (name, end) in zip(phases, phases[1:]):
+        print(f"  phase {name}: {(end - begin) / 1e6:.1f} ms")
             
     # Final check
     if pending_ids:
@@ -1,7 +1,8 @@
+from functools import lru_cache
 from pathlib import Path
 from pydantic import BaseModel
 import uuid
-from PIL import Image
+from PIL import Image, JpegImagePlugin
 from loguru import logger
 
 # ============================================================================
@@ -62,6 +63,57 @@ class AuthConfig(BaseModel):
     password: str | None
     user_info: UserInfo | None
     
+@lru_cache(maxsize=8)
+def _decode_source(
+    source_path: Path, mtime_ns: int
+) -> tuple[Image.Image, dict[str, object]]:
+    """
+    Decode a source image once and derive the options used to save its copies.
+
+    Cached so a batch of unique copies from one source pays for a single decode;
+    mtime_ns is part of the key so an edited source is read again.
+    """
+    with Image.open(source_path) as img:
+        img.load()
+        save_options: dict[str, object] = {}
+        # Pass the raw EXIF block through untouched; sources without one skip
+        # building an empty Exif object and writing an empty APP1 segment
+        exif_bytes = img.info.get("exif")
+        if exif_bytes:
+            save_options["exif"] = exif_bytes
+        if img.format == "JPEG":
+            # Re-encode with the source's own quantization tables and chroma
+            # subsampling instead of a fresh quality=95 table set
+            save_options["qtables"] = img.quantization
+            save_options["subsampling"] = JpegImagePlugin.get_sampling(img)
+        else:
+            save_options["quality"] = 95
+        return img.copy(), save_options
+
+
+def _perturb_tail_pixels(img: Image.Image, unique_id: bytes) -> None:
+    """
+    Add unique_id bytes to the first channel of the image's last pixels.
+
+    Works on the raw buffer of the bottom rows (crop -> tobytes -> paste) so the
+    whole strip is mutated in one pass instead of a getpixel/putpixel per pixel.
+    """
+    width, height = img.size
+    count = min(len(unique_id), width * height)
+    rows = -(-count // width)  # ceil: rows spanned by the last `count` pixels
+    top = height - rows
+
+    strip = img.crop((0, top, width, height))
+    bands = len(strip.getbands())
+    buf = bytearray(strip.tobytes())
+    last = width * rows - 1
+    for i in range(count):
+        offset = (last - i) * bands
+        buf[offset] = (buf[offset] + unique_id[i]) % 256
+
+    img.paste(Image.frombytes(strip.mode, strip.size, bytes(buf)), (0, top))
+
+
 def create_unique_copy(source_path: Path, dest_path: Path, offset: int = 0) -> None:
     """
     Create a unique copy of the image by modifying the last few pixels.
@@ -79,57 +131,26 @@ def create_unique_copy(source_path: Path, dest_path: Path, offset: int = 0) -> N
 
         # Try to open with PIL to modify pixels
         try:
-            with Image.open(source_path) as img:
-                # Force load to ensure we can access pixels
-                img.load()
-                
-                # Create a copy to modify
-                img_copy = img.copy()
-                
-                # Generate unique identifier
-                unique_id = uuid.uuid4().bytes
-
-                # Modify LAST 16 pixels (bottom-right) using the UUID bytes
-                # Only if image has pixels
-                if img_copy.width > 0 and img_copy.height > 0:
-                    width, height = img_copy.size
-                    total_pixels = width * height
-                    
-                    # Convert to mode that supports putpixel if needed/possible
-                    if img_copy.mode not in ('RGB', 'RGBA', 'L'):
-                         # Skip pixel modification for complex modes, fallback to metadata change or just copy
-                         pass
-                    else:
-                        for i, byte in enumerate(unique_id):
-                            idx = total_pixels - 1 - i
-                            if idx < 0: break # Safety check for very small images
-                            
-                            x = idx % width
-                            y = idx // width
-                            
-                            try:
-                                # Get pixel value - format depends on mode
-                                pixel_val = img_copy.getpixel((x, y))
-                                
-                                if isinstance(pixel_val, tuple):
-                                    # RGB or RGBA
-                                    pixel = list(pixel_val)
-                                    # Modify first channel
-                                    # Use modulo 256 to ensure valid range although byte is already 0-255
-                                    pixel[0] = (pixel[0] +byte) % 256
-                                    img_copy.putpixel((x, y), tuple(pixel))
-                                elif isinstance(pixel_val, int):
-                                    # L (grayscale)
-                                    new_val = (pixel_val + byte) % 256
-                                    img_copy.putpixel((x, y), new_val)
-                            except Exception:
-                                # Start ignore pixel modification errors
-                                pass
-                
-                # Save to new path with EXIF
-                exif_data = img.getexif()
-                img_copy.save(dest_path, exif=exif_data, quality=95)
-                return
+            source, save_options = _decode_source(
+                source_path, source_path.stat().st_mtime_ns
+            )
+
+            # Create a copy to modify (the decoded source is shared between calls)
+            img_copy = source.copy()
+
+            # Generate unique identifier
+            unique_id = uuid.uuid4().bytes
+
+            # Modify LAST 16 pixels (bottom-right) using the UUID bytes
+            # Only if image has pixels
+            if img_copy.width > 0 and img_copy.height > 0:
+                # Skip pixel modification for complex modes, fallback to just copy
+                if img_copy.mode in ('RGB', 'RGBA', 'L'):
+                    _perturb_tail_pixels(img_copy, unique_id)
+
+            # Save to new path with EXIF
+            img_copy.save(dest_path, **save_options)
+            return
 
         except Exception as e:
             logger.warning(f"PIL modification failed for {source_path}: {e}")
@@ -138,6 +159,7 @@ def create_unique_copy(source_path: Path, dest_path: Path, offset: int = 0) -> N
     except Exception as e:
         logger.error(f"Error preparing unique image {source_path}: {e}")
         
-    # Fallback to simple copy
+    # Fallback to simple copy (copyfile lets the kernel move the bytes via
+    # sendfile/copy_file_range; copy2's extra stat/utime calls are not needed)
     import shutil
-    shutil.copy2(source_path, dest_path)
+    _ = shutil.copyfile(source_path, dest_path)